@@ -1,8 +1,8 @@
+from x402.networks import EVM_NETWORK_TO_CHAIN_ID
+
+# String-keyed view of the single network table in x402.networks
 NETWORK_TO_ID = {
-    "base-sepolia": "84532",
-    "base": "8453",
-    "avalanche-fuji": "43113",
-    "avalanche": "43114",
+    network: str(chain_id) for network, chain_id in EVM_NETWORK_TO_CHAIN_ID.items()
 }
 
 
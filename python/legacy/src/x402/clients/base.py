@@ -167,6 +167,7 @@ class x402Client:
         Returns:
             Signed payment header
         """
+        now = time.time_ns() // 1_000_000_000
         unsigned_header = {
             "x402Version": x402_version,
             "scheme": payment_requirements.scheme,
@@ -177,10 +178,8 @@ class x402Client:
                     "from": self.account.address,
                     "to": payment_requirements.pay_to,
                     "value": payment_requirements.max_amount_required,
-                    "validAfter": str(int(time.time()) - 60),  # 60 seconds before
-                    "validBefore": str(
-                        int(time.time()) + payment_requirements.max_timeout_seconds
-                    ),
+                    "validAfter": str(now - 60),  # 60 seconds before
+                    "validBefore": str(now + payment_requirements.max_timeout_seconds),
                     "nonce": self.generate_nonce(),
                 },
             },
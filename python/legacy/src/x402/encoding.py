@@ -1,6 +1,8 @@
-import base64
+import binascii
 from typing import Union
 
+from pydantic import BaseModel
+
 
 def safe_base64_encode(data: Union[str, bytes]) -> str:
     """Safely encode string or bytes to base64 string.
@@ -13,7 +15,8 @@ def safe_base64_encode(data: Union[str, bytes]) -> str:
     """
     if isinstance(data, str):
         data = data.encode("utf-8")
-    return base64.b64encode(data).decode("utf-8")
+    # binascii is the C codec behind base64.b64encode, minus the wrapper call
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
 
 
 def safe_base64_decode(data: str) -> str:
@@ -25,4 +28,30 @@ def safe_base64_decode(data: str) -> str:
     Returns:
         Decoded utf-8 string
     """
-    return base64.b64decode(data).decode("utf-8")
+    return binascii.a2b_base64(data).decode("utf-8")
+
+
+def safe_base64_decode_bytes(data: str) -> bytes:
+    """Decode base64 string to raw bytes without a utf-8 round trip.
+
+    Args:
+        data: Base64 encoded string
+
+    Returns:
+        Decoded bytes, suitable for json.loads or model_validate_json
+    """
+    return binascii.a2b_base64(data)
+
+
+def safe_base64_encode_model(model: BaseModel) -> str:
+    """Serialize a pydantic model to camelCase JSON and encode it as base64.
+
+    Args:
+        model: Pydantic model to serialize (using field aliases)
+
+    Returns:
+        Base64 encoded JSON string
+    """
+    # Serialize straight to bytes; model_dump_json would decode to str first
+    json_bytes = model.__pydantic_serializer__.to_json(model, by_alias=True)
+    return binascii.b2a_base64(json_bytes, newline=False).decode("ascii")
@@ -5,7 +5,8 @@ from typing_extensions import (
     TypedDict,
 )  # use `typing_extensions.TypedDict` instead of `typing.TypedDict` on Python < 3.12
 from eth_account import Account
-from x402.encoding import safe_base64_encode, safe_base64_decode
+from hexbytes import HexBytes
+from x402.encoding import safe_base64_encode, safe_base64_decode_bytes
 from x402.types import (
     PaymentRequirements,
 )
@@ -13,6 +14,19 @@ from x402.chains import get_chain_id
 import json
 
 
+# EIP-712 schema for EIP-3009 transferWithAuthorization; static, so built once
+TRANSFER_WITH_AUTHORIZATION_TYPES = {
+    "TransferWithAuthorization": [
+        {"name": "from", "type": "address"},
+        {"name": "to", "type": "address"},
+        {"name": "value", "type": "uint256"},
+        {"name": "validAfter", "type": "uint256"},
+        {"name": "validBefore", "type": "uint256"},
+        {"name": "nonce", "type": "bytes32"},
+    ]
+}
+
+
 def create_nonce() -> bytes:
     """Create a random 32-byte nonce for authorization signatures."""
     return secrets.token_bytes(32)
@@ -23,8 +37,9 @@ def prepare_payment_header(
 ) -> Dict[str, Any]:
     """Prepare an unsigned payment header with sender address, x402 version, and payment requirements."""
     nonce = create_nonce()
-    valid_after = str(int(time.time()) - 60)  # 60 seconds before
-    valid_before = str(int(time.time()) + payment_requirements.max_timeout_seconds)
+    now = time.time_ns() // 1_000_000_000
+    valid_after = str(now - 60)  # 60 seconds before
+    valid_before = str(now + payment_requirements.max_timeout_seconds)
 
     return {
         "x402Version": x402_version,
@@ -58,19 +73,17 @@ def sign_payment_header(
     try:
         auth = header["payload"]["authorization"]
 
-        nonce_bytes = bytes.fromhex(auth["nonce"])
+        # Accept the raw bytes from create_nonce() as well as a hex string
+        nonce = auth["nonce"]
+        if isinstance(nonce, bytes):
+            nonce_bytes = nonce
+            nonce_hex = nonce.hex()
+        else:
+            nonce_bytes = bytes.fromhex(nonce)
+            nonce_hex = nonce
 
         typed_data = {
-            "types": {
-                "TransferWithAuthorization": [
-                    {"name": "from", "type": "address"},
-                    {"name": "to", "type": "address"},
-                    {"name": "value", "type": "uint256"},
-                    {"name": "validAfter", "type": "uint256"},
-                    {"name": "validBefore", "type": "uint256"},
-                    {"name": "nonce", "type": "bytes32"},
-                ]
-            },
+            "types": TRANSFER_WITH_AUTHORIZATION_TYPES,
             "primaryType": "TransferWithAuthorization",
             "domain": {
                 "name": payment_requirements.extra["name"],
@@ -99,7 +112,7 @@ def sign_payment_header(
 
         header["payload"]["signature"] = signature
 
-        header["payload"]["authorization"]["nonce"] = f"0x{auth['nonce']}"
+        header["payload"]["authorization"]["nonce"] = f"0x{nonce_hex}"
 
         encoded = encode_payment(header)
         return encoded
@@ -107,24 +120,25 @@ def sign_payment_header(
         raise
 
 
+def _json_default(obj: Any) -> Any:
+    """Serialize HexBytes and other non-JSON types found in payment payloads."""
+    if isinstance(obj, HexBytes):
+        return obj.hex()
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if hasattr(obj, "hex"):
+        return obj.hex()
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
 def encode_payment(payment_payload: Dict[str, Any]) -> str:
     """Encode a payment payload into a base64 string, handling HexBytes and other non-serializable types."""
-    from hexbytes import HexBytes
-
-    def default(obj):
-        if isinstance(obj, HexBytes):
-            return obj.hex()
-        if hasattr(obj, "to_dict"):
-            return obj.to_dict()
-        if hasattr(obj, "hex"):
-            return obj.hex()
-        raise TypeError(
-            f"Object of type {obj.__class__.__name__} is not JSON serializable"
-        )
-
-    return safe_base64_encode(json.dumps(payment_payload, default=default))
+    # Compact separators keep the header small and match JSON.stringify output
+    return safe_base64_encode(
+        json.dumps(payment_payload, default=_json_default, separators=(",", ":"))
+    )
 
 
 def decode_payment(encoded_payment: str) -> Dict[str, Any]:
     """Decode a base64 encoded payment string back into a PaymentPayload object."""
-    return json.loads(safe_base64_decode(encoded_payment))
+    return json.loads(safe_base64_decode_bytes(encoded_payment))
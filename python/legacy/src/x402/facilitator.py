@@ -1,4 +1,8 @@
+import asyncio
 import inspect
+import os
+import threading
+from weakref import WeakKeyDictionary
 from typing import Callable, Optional
 from typing_extensions import (
     TypedDict,
@@ -39,6 +43,65 @@ class FacilitatorClient:
             url = url[:-1]
 
         self.config = {"url": url, "create_headers": config.get("create_headers")}
+        # One pooled HTTP client per event loop, since a connection pool is bound
+        # to the loop it was opened on. Several loops can use the same instance
+        # at once (e.g. Flask middlewares sharing a client, each on its own loop).
+        # Each client is stored with the pid that opened it, so clients inherited
+        # across a fork can be told apart from the child's own.
+        self._http_clients: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, tuple[int, httpx.AsyncClient]
+        ] = WeakKeyDictionary()
+        self._http_clients_lock = threading.Lock()
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client for the running event loop.
+
+        Connections are kept alive across calls on the same loop. Clients left
+        behind by closed loops, or inherited from a parent process, are dropped
+        when a new one is made.
+        """
+        loop = asyncio.get_running_loop()
+        pid = os.getpid()
+        with self._http_clients_lock:
+            entry = self._http_clients.get(loop)
+            if entry is not None and entry[0] == pid:
+                return entry[1]
+            self._drop_stale_clients(pid)
+            client = httpx.AsyncClient()
+            self._http_clients[loop] = (pid, client)
+        return client
+
+    def _drop_stale_clients(self, pid: int) -> None:
+        """Forget clients whose loop has closed or that another process opened.
+
+        Their connections cannot be closed from here: a closed loop can no longer
+        run aclose, and a parent's loop does not run in a forked child even
+        though it may still report is_running(). Must hold _http_clients_lock.
+        """
+        stale = [
+            loop
+            for loop, (owner_pid, _) in self._http_clients.items()
+            if owner_pid != pid or loop.is_closed()
+        ]
+        for loop in stale:
+            del self._http_clients[loop]
+
+    async def aclose(self) -> None:
+        """Close the HTTP client opened on the running event loop.
+
+        Clients on other loops are left alone: FacilitatorClient instances from
+        shared_facilitator_client are used by every middleware with the same
+        config, each of which may run on its own loop and closes its own client.
+        Clients from closed loops or a parent process are dropped.
+        """
+        loop = asyncio.get_running_loop()
+        pid = os.getpid()
+        with self._http_clients_lock:
+            entry = self._http_clients.pop(loop, None)
+            self._drop_stale_clients(pid)
+
+        if entry is not None and entry[0] == pid:
+            await entry[1].aclose()
 
     async def _get_custom_headers(self) -> dict[str, dict[str, str]] | None:
         """Get custom headers, supporting both sync and async create_headers functions."""
@@ -59,22 +122,22 @@ class FacilitatorClient:
         if custom_headers:
             headers.update(custom_headers.get("verify", {}))
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.config['url']}/verify",
-                json={
-                    "x402Version": payment.x402_version,
-                    "paymentPayload": payment.model_dump(by_alias=True),
-                    "paymentRequirements": payment_requirements.model_dump(
-                        by_alias=True, exclude_none=True
-                    ),
-                },
-                headers=headers,
-                follow_redirects=True,
-            )
-
-            data = response.json()
-            return VerifyResponse(**data)
+        client = self._get_async_client()
+        response = await client.post(
+            f"{self.config['url']}/verify",
+            json={
+                "x402Version": payment.x402_version,
+                "paymentPayload": payment.model_dump(by_alias=True),
+                "paymentRequirements": payment_requirements.model_dump(
+                    by_alias=True, exclude_none=True
+                ),
+            },
+            headers=headers,
+            follow_redirects=True,
+        )
+
+        data = response.json()
+        return VerifyResponse(**data)
 
     async def settle(
         self, payment: PaymentPayload, payment_requirements: PaymentRequirements
@@ -85,21 +148,21 @@ class FacilitatorClient:
         if custom_headers:
             headers.update(custom_headers.get("settle", {}))
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.config['url']}/settle",
-                json={
-                    "x402Version": payment.x402_version,
-                    "paymentPayload": payment.model_dump(by_alias=True),
-                    "paymentRequirements": payment_requirements.model_dump(
-                        by_alias=True, exclude_none=True
-                    ),
-                },
-                headers=headers,
-                follow_redirects=True,
-            )
-            data = response.json()
-            return SettleResponse(**data)
+        client = self._get_async_client()
+        response = await client.post(
+            f"{self.config['url']}/settle",
+            json={
+                "x402Version": payment.x402_version,
+                "paymentPayload": payment.model_dump(by_alias=True),
+                "paymentRequirements": payment_requirements.model_dump(
+                    by_alias=True, exclude_none=True
+                ),
+            },
+            headers=headers,
+            follow_redirects=True,
+        )
+        data = response.json()
+        return SettleResponse(**data)
 
     async def list(
         self, request: Optional[ListDiscoveryResourcesRequest] = None
@@ -128,18 +191,42 @@ class FacilitatorClient:
             if v is not None
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.config['url']}/discovery/resources",
-                params=params,
-                headers=headers,
-                follow_redirects=True,
+        client = self._get_async_client()
+        response = await client.get(
+            f"{self.config['url']}/discovery/resources",
+            params=params,
+            headers=headers,
+            follow_redirects=True,
+        )
+
+        if response.status_code != 200:
+            raise ValueError(
+                f"Failed to list discovery resources: {response.status_code} {response.text}"
             )
 
-            if response.status_code != 200:
-                raise ValueError(
-                    f"Failed to list discovery resources: {response.status_code} {response.text}"
-                )
+        data = response.json()
+        return ListDiscoveryResourcesResponse(**data)
 
-            data = response.json()
-            return ListDiscoveryResourcesResponse(**data)
+
+_shared_clients: dict[tuple[str | None, Callable | None], FacilitatorClient] = {}
+
+
+def shared_facilitator_client(
+    config: FacilitatorConfig | None = None,
+) -> FacilitatorClient:
+    """Get a FacilitatorClient shared by every caller with the same config.
+
+    Middlewares registered for several routes then reuse one connection pool
+    to the facilitator instead of opening their own.
+
+    Args:
+        config: Facilitator configuration, as accepted by FacilitatorClient
+
+    Returns:
+        The shared FacilitatorClient for this url and create_headers pair
+    """
+    key = (config.get("url"), config.get("create_headers")) if config else (None, None)
+    client = _shared_clients.get(key)
+    if client is None:
+        client = _shared_clients[key] = FacilitatorClient(config)
+    return client
@@ -1,10 +1,9 @@
-import base64
-import json
 import logging
+from functools import lru_cache
 from typing import Any, Callable, Optional, get_args, cast
 
 from fastapi import Request
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from pydantic import validate_call
 
 from x402.common import (
@@ -12,9 +11,10 @@ from x402.common import (
     x402_VERSION,
     find_matching_payment_requirements,
 )
-from x402.encoding import safe_base64_decode
-from x402.facilitator import FacilitatorClient, FacilitatorConfig
-from x402.path import path_is_match
+from x402.encoding import safe_base64_decode_bytes, safe_base64_encode_model
+from x402.networks import SUPPORTED_NETWORKS_SET
+from x402.facilitator import FacilitatorConfig, shared_facilitator_client
+from x402.path import cached_path_is_match
 from x402.paywall import is_browser_request, get_paywall_html
 from x402.types import (
     PaymentPayload,
@@ -73,10 +73,9 @@ def require_payment(
     """
 
     # Validate network is supported
-    supported_networks = get_args(SupportedNetworks)
-    if network not in supported_networks:
+    if network not in SUPPORTED_NETWORKS_SET:
         raise ValueError(
-            f"Unsupported network: {network}. Must be one of: {supported_networks}"
+            f"Unsupported network: {network}. Must be one of: {get_args(SupportedNetworks)}"
         )
 
     try:
@@ -86,93 +85,160 @@ def require_payment(
     except Exception as e:
         raise ValueError(f"Invalid price: {price}. Error: {e}")
 
-    facilitator = FacilitatorClient(facilitator_config)
+    facilitator = shared_facilitator_client(facilitator_config)
 
-    async def middleware(request: Request, call_next: Callable):
-        # Skip if the path is not the same as the path in the middleware
-        if not path_is_match(path, request.url.path):
-            return await call_next(request)
+    path_patterns = (path,) if isinstance(path, str) else tuple(path)
+    # A bare "*" glob matches every path, alone or inside a list
+    match_all = "*" in path_patterns
 
-        # Get resource URL if not explicitly provided
-        resource_url = resource or str(request.url)
+    # Validate the fixed fields once; per-URL copies only swap in the resource
+    # and output schema, so they skip pydantic re-validation
+    requirements_template = PaymentRequirements(
+        scheme="exact",
+        network=cast(SupportedNetworks, network),
+        asset=asset_address,
+        max_amount_required=max_amount_required,
+        resource="",
+        description=description,
+        mime_type=mime_type,
+        pay_to=pay_to_address,
+        max_timeout_seconds=max_deadline_seconds,
+        extra=eip712_domain,
+    )
 
-        # Construct payment details
-        payment_requirements = [
-            PaymentRequirements(
-                scheme="exact",
-                network=cast(SupportedNetworks, network),
-                asset=asset_address,
-                max_amount_required=max_amount_required,
-                resource=resource_url,
-                description=description,
-                mime_type=mime_type,
-                pay_to=pay_to_address,
-                max_timeout_seconds=max_deadline_seconds,
-                # TODO: Rename output_schema to request_structure
-                output_schema={
-                    "input": {
-                        "type": "http",
-                        "method": request.method.upper(),
-                        "discoverable": discoverable
-                        if discoverable is not None
-                        else True,
-                        **(
-                            input_schema.model_dump(exclude_none=True)
-                            if input_schema
-                            else {}
-                        ),
+    # Fixed parts of the output schema's input description
+    is_discoverable = discoverable if discoverable is not None else True
+    input_schema_fields = (
+        input_schema.model_dump(exclude_none=True) if input_schema else {}
+    )
+
+    # Requirements only vary by resource URL and method, so repeat requests to the
+    # same URL reuse the built models instead of rebuilding them
+    @lru_cache(maxsize=64)
+    def build_payment_requirements(
+        resource_url: str, method: str
+    ) -> list[PaymentRequirements]:
+        return [
+            requirements_template.model_copy(
+                # Deep, so cached models do not share the template's extra dict
+                deep=True,
+                update={
+                    "resource": resource_url,
+                    # TODO: Rename output_schema to request_structure
+                    "output_schema": {
+                        "input": {
+                            "type": "http",
+                            "method": method,
+                            "discoverable": is_discoverable,
+                            **input_schema_fields,
+                        },
+                        "output": output_schema,
                     },
-                    "output": output_schema,
                 },
-                extra=eip712_domain,
             )
         ]
 
-        def x402_response(error: str):
-            """Create a 402 response with payment requirements."""
-            request_headers = dict(request.headers)
-            status_code = 402
+    # With a fixed, non-empty resource URL the paywall page only varies by error
+    # and method. Rendered pages are ~2MB, so keep just a handful around.
+    @lru_cache(maxsize=4)
+    def static_paywall_html(error: str, method: str) -> bytes:
+        return get_paywall_html(
+            error,
+            build_payment_requirements(cast(str, resource), method),
+            paywall_config,
+        ).encode("utf-8")
+
+    def payment_required_json(
+        error: str, payment_requirements: list[PaymentRequirements]
+    ) -> bytes:
+        # Serialize in pydantic-core instead of model_dump + json.dumps
+        return (
+            x402PaymentRequiredResponse(
+                x402_version=x402_VERSION,
+                accepts=payment_requirements,
+                error=error,
+            )
+            .model_dump_json(by_alias=True)
+            .encode("utf-8")
+        )
+
+    # With a fixed, non-empty resource URL the JSON body is fixed per error and method
+    @lru_cache(maxsize=32)
+    def static_payment_required_json(error: str, method: str) -> bytes:
+        return payment_required_json(
+            error, build_payment_requirements(cast(str, resource), method)
+        )
 
-            if is_browser_request(request_headers):
-                html_content = custom_paywall_html or get_paywall_html(
+    def x402_response(
+        request: Request,
+        method: str,
+        payment_requirements: list[PaymentRequirements],
+        error: str,
+    ):
+        """Create a 402 response with payment requirements."""
+        status_code = 402
+
+        if is_browser_request(request.headers):
+            if custom_paywall_html:
+                html_content: str | bytes = custom_paywall_html
+            elif resource:
+                html_content = static_paywall_html(error, method)
+            else:
+                html_content = get_paywall_html(
                     error, payment_requirements, paywall_config
                 )
-                headers = {"Content-Type": "text/html; charset=utf-8"}
+            headers = {"Content-Type": "text/html; charset=utf-8"}
 
-                return HTMLResponse(
-                    content=html_content,
-                    status_code=status_code,
-                    headers=headers,
-                )
+            return HTMLResponse(
+                content=html_content,
+                status_code=status_code,
+                headers=headers,
+            )
+        else:
+            if resource:
+                response_body = static_payment_required_json(error, method)
             else:
-                response_data = x402PaymentRequiredResponse(
-                    x402_version=x402_VERSION,
-                    accepts=payment_requirements,
-                    error=error,
-                ).model_dump(by_alias=True)
-                headers = {"Content-Type": "application/json"}
-
-                return JSONResponse(
-                    content=response_data,
-                    status_code=status_code,
-                    headers=headers,
-                )
+                response_body = payment_required_json(error, payment_requirements)
+            headers = {"Content-Type": "application/json"}
+
+            return Response(
+                content=response_body,
+                status_code=status_code,
+                headers=headers,
+            )
+
+    async def middleware(request: Request, call_next: Callable):
+        # Skip if the path is not the same as the path in the middleware
+        if not match_all and not cached_path_is_match(path_patterns, request.url.path):
+            return await call_next(request)
+
+        # Get resource URL if not explicitly provided
+        resource_url = resource or str(request.url)
+        method = request.method  # ASGI methods are already uppercase
+
+        # Construct payment details
+        payment_requirements = build_payment_requirements(resource_url, method)
 
         # Check for payment header
         payment_header = request.headers.get("X-PAYMENT", "")
 
         if payment_header == "":
-            return x402_response("No X-PAYMENT header provided")
+            return x402_response(
+                request, method, payment_requirements, "No X-PAYMENT header provided"
+            )
 
         # Decode payment header
         try:
-            payment_dict = json.loads(safe_base64_decode(payment_header))
-            payment = PaymentPayload(**payment_dict)
+            payment = PaymentPayload.model_validate_json(
+                safe_base64_decode_bytes(payment_header)
+            )
         except Exception as e:
             logger.warning(
                 f"Invalid payment header format from {request.client.host if request.client else 'unknown'}: {str(e)}"
             )
-            return x402_response("Invalid payment header format")
+            return x402_response(
+                request, method, payment_requirements, "Invalid payment header format"
+            )
 
         # Find matching payment requirements
         selected_payment_requirements = find_matching_payment_requirements(
@@ -180,7 +246,12 @@ def require_payment(
         )
 
         if not selected_payment_requirements:
-            return x402_response("No matching payment requirements found")
+            return x402_response(
+                request,
+                method,
+                payment_requirements,
+                "No matching payment requirements found",
+            )
 
         # Verify payment
         verify_response = await facilitator.verify(
@@ -189,8 +260,18 @@ def require_payment(
 
         if not verify_response.is_valid:
             error_reason = verify_response.invalid_reason or "Unknown error"
-            return x402_response(f"Invalid payment: {error_reason}")
+            return x402_response(
+                request,
+                method,
+                payment_requirements,
+                f"Invalid payment: {error_reason}",
+            )
 
+        # The matched model is shared through the requirements cache; give the
+        # route its own copy so changes to it cannot leak into later requests
+        selected_payment_requirements = selected_payment_requirements.model_copy(
+            deep=True
+        )
         request.state.payment_details = selected_payment_requirements
         request.state.verify_response = verify_response
 
@@ -207,16 +288,19 @@ def require_payment(
                 payment, selected_payment_requirements
             )
             if settle_response.success:
-                response.headers["X-PAYMENT-RESPONSE"] = base64.b64encode(
-                    settle_response.model_dump_json(by_alias=True).encode("utf-8")
-                ).decode("utf-8")
+                response.headers["X-PAYMENT-RESPONSE"] = safe_base64_encode_model(
+                    settle_response
+                )
             else:
                 return x402_response(
+                    request,
+                    method,
+                    payment_requirements,
                     "Settle failed: "
-                    + (settle_response.error_reason or "Unknown error")
+                    + (settle_response.error_reason or "Unknown error"),
                 )
         except Exception:
-            return x402_response("Settle failed")
+            return x402_response(request, method, payment_requirements, "Settle failed")
 
         return response
 
@@ -1,8 +1,12 @@
-import base64
-import json
+import asyncio
+import os
+import threading
+from functools import lru_cache
+from itertools import chain, islice
 from typing import Any, Dict, Optional, Union, get_args, cast
 from flask import Flask, request, g
-from x402.path import path_is_match
+from werkzeug.wsgi import ClosingIterator
+from x402.path import cached_path_is_match
 from x402.types import (
     Price,
     PaymentPayload,
@@ -17,13 +21,22 @@ from x402.common import (
     x402_VERSION,
     find_matching_payment_requirements,
 )
-from x402.encoding import safe_base64_decode
-from x402.facilitator import FacilitatorClient, FacilitatorConfig
+from x402.encoding import safe_base64_decode_bytes, safe_base64_encode_model
+from x402.networks import SUPPORTED_NETWORKS_SET
+from x402.facilitator import (
+    FacilitatorClient,
+    FacilitatorConfig,
+    shared_facilitator_client,
+)
 from x402.paywall import is_browser_request, get_paywall_html
 
 
 class ResponseWrapper:
-    """Wrapper to capture and buffer response for settlement logic."""
+    """Wrapper to capture the response status and headers for settlement logic.
+
+    The status and headers are held back until settlement has run; the body is
+    then sent from the buffered chunks, or streamed from the app when enabled.
+    """
 
     def __init__(self, start_response):
         self.original_start_response = start_response
@@ -31,15 +44,18 @@ class ResponseWrapper:
         self.status = None
         self.headers = []
         self.write_callable_chunks = []
+        self.write = None
 
     def __call__(self, status, headers, exc_info=None):
-        # Buffer the status, headers and write callable chunks
+        # Buffer the status, headers and any write callable chunks sent early
         self.status = status
         self.status_code = int(status.split()[0])
         self.headers = list(headers)
 
         def buffered_write(data):
-            if data:
+            if self.write is not None:
+                self.write(data)
+            elif data:
                 self.write_callable_chunks.append(data)
 
         return buffered_write
@@ -49,16 +65,10 @@ class ResponseWrapper:
         self.headers.append((name, value))
 
     def send_response(self, body_chunks):
-        """Send the buffered response after settlement."""
-        write = self.original_start_response(self.status, self.headers)
-        # Send data written via write callable first
-        for chunk in self.write_callable_chunks:
-            if chunk:
-                write(chunk)
-        # Then send data from response iterator
-        for chunk in body_chunks:
-            if chunk:
-                write(chunk)
+        """Start the held-back response and return its body iterable."""
+        self.write = self.original_start_response(self.status, self.headers)
+        # Data written via the write callable comes before the iterator's data
+        return chain(self.write_callable_chunks, body_chunks)
 
 
 class PaymentMiddleware:
@@ -70,12 +80,67 @@ class PaymentMiddleware:
         middleware = PaymentMiddleware(app)
         middleware.add(path="/weather", price="$0.001", pay_to_address="0x...")
         middleware.add(path="/premium/*", price=TokenAmount(...), pay_to_address="0x...")
+
+    By default the whole response body is buffered and the payment is only
+    settled once the route has returned it with a 2xx status, so a route that
+    fails part way through is never charged. Registrations added with
+    stream_response=True instead settle as soon as the status is known and
+    then stream the body: an error part way through the stream does not undo
+    the payment, and the body is iterated outside the request context (wrap
+    generators that need the request in flask.stream_with_context).
     """
 
     def __init__(self, app: Flask):
         self.app = app
         self.middleware_configs = []
         self.original_wsgi_app = app.wsgi_app
+        self._wsgi_app = app.wsgi_app
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        self._loop_pid: int | None = None
+        self._loop_lock = threading.Lock()
+        self._facilitators: list[FacilitatorClient] = []
+
+    def _run_async(self, coro):
+        """Run a facilitator coroutine on the middleware's background event loop.
+
+        Keeping one loop alive lets the facilitator client reuse its connection
+        pool across requests. The loop thread is started lazily and restarted in
+        forked workers, since threads do not survive a fork.
+        """
+        with self._loop_lock:
+            if self._loop is None or self._loop_pid != os.getpid():
+                self._loop = asyncio.new_event_loop()
+                self._loop_pid = os.getpid()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="x402-flask-facilitator",
+                    daemon=True,
+                )
+                self._loop_thread.start()
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def close(self) -> None:
+        """Close facilitator connections and stop the background event loop.
+
+        Call this at shutdown, once in-flight requests have finished. A later
+        paid request starts a new loop. In a forked child the inherited loop
+        never ran, so it is simply forgotten.
+        """
+        with self._loop_lock:
+            loop, thread, pid = self._loop, self._loop_thread, self._loop_pid
+            self._loop = self._loop_thread = self._loop_pid = None
+        if loop is None or thread is None or pid != os.getpid():
+            return
+
+        try:
+            for facilitator in self._facilitators:
+                asyncio.run_coroutine_threadsafe(facilitator.aclose(), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
 
     def add(
         self,
@@ -93,6 +158,7 @@ class PaymentMiddleware:
         resource: Optional[str] = None,
         paywall_config: Optional[PaywallConfig] = None,
         custom_paywall_html: Optional[str] = None,
+        stream_response: bool = False,
     ):
         """
         Add a payment middleware configuration.
@@ -112,6 +178,9 @@ class PaymentMiddleware:
             resource (str, optional): Resource URL
             paywall_config (PaywallConfig, optional): Paywall UI customization config
             custom_paywall_html (str, optional): Custom HTML to display for paywall instead of default
+            stream_response (bool, optional): Settle before the body is produced and stream it
+                instead of buffering it. The payer is charged even if the body then fails.
+                Defaults to False.
         """
         config = {
             "price": price,
@@ -128,30 +197,29 @@ class PaymentMiddleware:
             "resource": resource,
             "paywall_config": paywall_config,
             "custom_paywall_html": custom_paywall_html,
+            "stream_response": stream_response,
         }
         self.middleware_configs.append(config)
 
         # Apply the middleware to the app
-        self._apply_middleware()
+        self._apply_middleware(config)
 
-    def _apply_middleware(self):
-        """Apply all middleware configurations to the Flask app."""
-        current_wsgi_app = self.original_wsgi_app
+    def _apply_middleware(self, config: dict[str, Any]):
+        """Wrap the middleware chain with a newly added configuration.
 
-        for config in self.middleware_configs:
-            middleware = self._create_middleware(config, current_wsgi_app)
-            current_wsgi_app = middleware
-
-        self.app.wsgi_app = current_wsgi_app
+        Earlier registrations keep their middleware (and its caches) rather than
+        being rebuilt on every add().
+        """
+        self._wsgi_app = self._create_middleware(config, self._wsgi_app)
+        self.app.wsgi_app = self._wsgi_app
 
     def _create_middleware(self, config: Dict[str, Any], next_app):
         """Create a WSGI middleware function for the given configuration."""
 
         # Validate network is supported
-        supported_networks = get_args(SupportedNetworks)
-        if config["network"] not in supported_networks:
+        if config["network"] not in SUPPORTED_NETWORKS_SET:
             raise ValueError(
-                f"Unsupported network: {config['network']}. Must be one of: {supported_networks}"
+                f"Unsupported network: {config['network']}. Must be one of: {get_args(SupportedNetworks)}"
             )
 
         # Process price configuration
@@ -162,13 +230,84 @@ class PaymentMiddleware:
         except Exception as e:
             raise ValueError(f"Invalid price: {config['price']}. Error: {e}")
 
-        facilitator = FacilitatorClient(config["facilitator_config"])
+        facilitator = shared_facilitator_client(config["facilitator_config"])
+        if facilitator not in self._facilitators:
+            self._facilitators.append(facilitator)
+
+        path_patterns = (
+            (config["path"],)
+            if isinstance(config["path"], str)
+            else tuple(config["path"])
+        )
+        # A bare "*" glob matches every path, alone or inside a list
+        match_all = "*" in path_patterns
+
+        # Fixed parts of the output schema's input description
+        discoverable = config.get("discoverable", True)
+        input_schema_fields = (
+            config["input_schema"].model_dump(exclude_none=True)
+            if config["input_schema"]
+            else {}
+        )
+
+        # Validate the fixed fields once; per-URL copies only swap in the resource
+        # and output schema, so they skip pydantic re-validation
+        requirements_template = PaymentRequirements(
+            scheme="exact",
+            network=cast(SupportedNetworks, config["network"]),
+            asset=asset_address,
+            max_amount_required=max_amount_required,
+            resource="",
+            description=config["description"],
+            mime_type=config["mime_type"],
+            pay_to=config["pay_to_address"],
+            max_timeout_seconds=config["max_deadline_seconds"],
+            extra=eip712_domain,
+        )
+
+        # Requirements only vary by resource URL and method, so repeat requests to
+        # the same URL reuse the built models instead of rebuilding them
+        @lru_cache(maxsize=64)
+        def build_payment_requirements(
+            resource_url: str, method: str
+        ) -> list[PaymentRequirements]:
+            return [
+                requirements_template.model_copy(
+                    # Deep, so cached models do not share the template's extra dict
+                    deep=True,
+                    update={
+                        "resource": resource_url,
+                        # TODO: Rename output_schema to request_structure
+                        "output_schema": {
+                            "input": {
+                                "type": "http",
+                                "method": method,
+                                "discoverable": discoverable,
+                                **input_schema_fields,
+                            },
+                            "output": config["output_schema"],
+                        },
+                    },
+                )
+            ]
+
+        # With a fixed, non-empty resource URL the paywall page only varies by
+        # error and method. Rendered pages are ~2MB, so keep just a handful around.
+        @lru_cache(maxsize=4)
+        def static_paywall_html(error: str, method: str) -> bytes:
+            return get_paywall_html(
+                error,
+                build_payment_requirements(config["resource"], method),
+                config["paywall_config"],
+            ).encode("utf-8")
 
         def middleware(environ, start_response):
             # Create Flask request context
             with self.app.request_context(environ):
                 # Skip if the path is not the same as the path in the middleware
-                if not path_is_match(config["path"], request.path):
+                if not match_all and not cached_path_is_match(
+                    path_patterns, request.path
+                ):
                     return next_app(environ, start_response)
 
                 # Get resource URL if not explicitly provided
@@ -181,64 +320,46 @@ class PaymentMiddleware:
                     resource_url = config["resource"] or request.url
 
                 # Construct payment details
-                payment_requirements = [
-                    PaymentRequirements(
-                        scheme="exact",
-                        network=cast(SupportedNetworks, config["network"]),
-                        asset=asset_address,
-                        max_amount_required=max_amount_required,
-                        resource=resource_url,
-                        description=config["description"],
-                        mime_type=config["mime_type"],
-                        pay_to=config["pay_to_address"],
-                        max_timeout_seconds=config["max_deadline_seconds"],
-                        # TODO: Rename output_schema to request_structure
-                        output_schema={
-                            "input": {
-                                "type": "http",
-                                "method": request.method.upper(),
-                                "discoverable": config.get("discoverable", True),
-                                **(
-                                    config["input_schema"].model_dump(exclude_none=True)
-                                    if config["input_schema"]
-                                    else {}
-                                ),
-                            },
-                            "output": config["output_schema"],
-                        },
-                        extra=eip712_domain,
-                    )
-                ]
+                method = request.method.upper()
+                payment_requirements = build_payment_requirements(resource_url, method)
 
                 def x402_response(error: str):
                     """Create a 402 response with payment requirements."""
-                    request_headers = dict(request.headers)
                     status = "402 Payment Required"
 
-                    if is_browser_request(request_headers):
-                        html_content = config[
-                            "custom_paywall_html"
-                        ] or get_paywall_html(
-                            error, payment_requirements, config["paywall_config"]
-                        )
+                    if is_browser_request(request.headers):
+                        if config["custom_paywall_html"]:
+                            html_body = config["custom_paywall_html"].encode("utf-8")
+                        elif config["resource"] and not original_uri:
+                            html_body = static_paywall_html(error, method)
+                        else:
+                            html_body = get_paywall_html(
+                                error, payment_requirements, config["paywall_config"]
+                            ).encode("utf-8")
                         headers = [("Content-Type", "text/html; charset=utf-8")]
 
                         start_response(status, headers)
-                        return [html_content.encode("utf-8")]
+                        return [html_body]
                     else:
-                        response_data = x402PaymentRequiredResponse(
-                            x402_version=x402_VERSION,
-                            accepts=payment_requirements,
-                            error=error,
-                        ).model_dump(by_alias=True)
+                        # Serialize once in pydantic-core; the bytes give both the
+                        # body and its Content-Length
+                        response_body = (
+                            x402PaymentRequiredResponse(
+                                x402_version=x402_VERSION,
+                                accepts=payment_requirements,
+                                error=error,
+                            )
+                            .model_dump_json(by_alias=True)
+                            .encode("utf-8")
+                        )
 
                         headers = [
                             ("Content-Type", "application/json"),
-                            ("Content-Length", str(len(json.dumps(response_data)))),
+                            ("Content-Length", str(len(response_body))),
                         ]
 
                         start_response(status, headers)
-                        return [json.dumps(response_data).encode("utf-8")]
+                        return [response_body]
 
                 # Check for payment header
                 payment_header = request.headers.get("X-PAYMENT", "")
@@ -248,8 +369,9 @@ class PaymentMiddleware:
 
                 # Decode payment header
                 try:
-                    payment_dict = json.loads(safe_base64_decode(payment_header))
-                    payment = PaymentPayload(**payment_dict)
+                    payment = PaymentPayload.model_validate_json(
+                        safe_base64_decode_bytes(payment_header)
+                    )
                 except Exception as e:
                     return x402_response(f"Invalid payment header format: {str(e)}")
 
@@ -262,32 +384,46 @@ class PaymentMiddleware:
                     return x402_response("No matching payment requirements found")
 
                 # Verify payment (async call in sync context)
-                import asyncio
-
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    verify_response = loop.run_until_complete(
-                        facilitator.verify(payment, selected_payment_requirements)
-                    )
-                finally:
-                    loop.close()
+                verify_response = self._run_async(
+                    facilitator.verify(payment, selected_payment_requirements)
+                )
 
                 if not verify_response.is_valid:
                     error_reason = verify_response.invalid_reason or "Unknown error"
                     return x402_response(f"Invalid payment: {error_reason}")
 
-                # Store payment details in Flask g object
+                # Store payment details in Flask g object. The matched model is
+                # shared through the requirements cache, so the route gets its own
+                # copy and changes to it cannot leak into later requests
+                selected_payment_requirements = (
+                    selected_payment_requirements.model_copy(deep=True)
+                )
                 g.payment_details = selected_payment_requirements
                 g.verify_response = verify_response
 
                 # Create response wrapper to capture status and headers
                 response_wrapper = ResponseWrapper(start_response)
 
-                # Process the request and buffer all response chunks
-                response_body_chunks = []
-                for chunk in next_app(environ, response_wrapper):
-                    response_body_chunks.append(chunk)
+                # Process the request
+                app_iter = next_app(environ, response_wrapper)
+                close_app_iter = getattr(app_iter, "close", None)
+                if config["stream_response"]:
+                    # Apps may defer start_response until their first chunk, so
+                    # pull that one to learn the status
+                    body = iter(app_iter)
+                    first_chunks = []
+                    if response_wrapper.status is None:
+                        first_chunks.extend(islice(body, 1))
+                else:
+                    # Buffer the whole body so a route that fails part way through
+                    # is never settled
+                    try:
+                        first_chunks = list(app_iter)
+                    finally:
+                        if close_app_iter is not None:
+                            close_app_iter()
+                    body = iter(())
+                    close_app_iter = None
 
                 # Check if response is successful (2xx status code)
                 if (
@@ -297,38 +433,38 @@ class PaymentMiddleware:
                 ):
                     # Settle the payment for successful responses
                     try:
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        settle_response = loop.run_until_complete(
+                        settle_response = self._run_async(
                             facilitator.settle(payment, selected_payment_requirements)
                         )
 
                         if settle_response.success:
                             # Add settlement response header
-                            settlement_header = base64.b64encode(
-                                settle_response.model_dump_json(by_alias=True).encode(
-                                    "utf-8"
-                                )
-                            ).decode("utf-8")
+                            settlement_header = safe_base64_encode_model(
+                                settle_response
+                            )
                             response_wrapper.add_header(
                                 "X-PAYMENT-RESPONSE", settlement_header
                             )
                         else:
-                            # Settlement failed - discard buffered response and return 402
+                            # Settlement failed - discard the response and return 402
+                            if close_app_iter is not None:
+                                close_app_iter()
                             return x402_response(
                                 "Settle failed: "
                                 + (settle_response.error_reason or "Unknown error")
                             )
                     except Exception as e:
-                        # Settlement error - discard buffered response and return 402
+                        # Settlement error - discard the response and return 402
+                        if close_app_iter is not None:
+                            close_app_iter()
                         return x402_response(
                             "Settle failed: " + (str(e) or "Unknown error")
                         )
-                    finally:
-                        loop.close()
 
-                # Send the buffered response
-                response_wrapper.send_response(response_body_chunks)
-                return []
+                # Send the response, streaming any rest of the body from the app
+                return ClosingIterator(
+                    response_wrapper.send_response(chain(first_chunks, body)),
+                    close_app_iter,
+                )
 
         return middleware
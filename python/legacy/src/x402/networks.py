@@ -1,8 +1,10 @@
-from typing import Literal
+from typing import Literal, get_args
 
 
 SupportedNetworks = Literal["base", "base-sepolia", "avalanche-fuji", "avalanche"]
 
+SUPPORTED_NETWORKS_SET = frozenset(get_args(SupportedNetworks))
+
 EVM_NETWORK_TO_CHAIN_ID = {
     "base-sepolia": 84532,
     "base": 8453,
@@ -1,5 +1,6 @@
 import fnmatch
 import re
+from functools import lru_cache
 from typing import Union
 
 
@@ -41,3 +42,21 @@ def path_is_match(path: Union[str, list[str]], request_path: str) -> bool:
         return any(single_path_match(p) for p in path)
 
     return False
+
+
+@lru_cache(maxsize=2048)
+def cached_path_is_match(patterns: tuple[str, ...], request_path: str) -> bool:
+    """
+    Memoized variant of path_is_match for middleware hot paths.
+
+    Patterns are fixed per middleware, so decisions for repeat request paths
+    are served from a bounded LRU cache instead of being re-matched.
+
+    Args:
+        patterns: Path pattern(s) as a tuple so they can be hashed.
+        request_path: The actual request path to check.
+
+    Returns:
+        bool: True if the request path matches any of the patterns, False otherwise.
+    """
+    return path_is_match(list(patterns), request_path)
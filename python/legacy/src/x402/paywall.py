@@ -1,5 +1,5 @@
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Mapping, Optional
 
 from x402.types import PaymentRequirements, PaywallConfig
 from x402.common import x402_VERSION
@@ -7,6 +7,12 @@ from x402.evm_paywall_template import EVM_PAYWALL_TEMPLATE
 from x402.svm_paywall_template import SVM_PAYWALL_TEMPLATE
 
 
+# Templates are split at </head> once, so rendering a paywall concatenates the
+# config script between the two halves instead of scanning ~2MB for the tag
+_EVM_PAYWALL_PARTS = EVM_PAYWALL_TEMPLATE.partition("</head>")
+_SVM_PAYWALL_PARTS = SVM_PAYWALL_TEMPLATE.partition("</head>")
+
+
 def get_paywall_template(network: str) -> str:
     """Get the appropriate paywall template for the given network."""
     if network.startswith("solana:"):
@@ -14,24 +20,32 @@ def get_paywall_template(network: str) -> str:
     return EVM_PAYWALL_TEMPLATE
 
 
-def is_browser_request(headers: Dict[str, Any]) -> bool:
+def _get_paywall_template_parts(network: str) -> tuple[str, str, str]:
+    """Get the paywall template for the network, split around </head>."""
+    if network.startswith("solana:"):
+        return _SVM_PAYWALL_PARTS
+    return _EVM_PAYWALL_PARTS
+
+
+def is_browser_request(headers: Mapping[str, Any]) -> bool:
     """
     Determine if request is from a browser vs API client.
 
     Args:
-        headers: Dictionary of request headers (case-insensitive keys)
+        headers: Request headers. Plain dicts may use any key casing; framework
+            header objects (Starlette, Werkzeug) are looked up directly since
+            they are already case-insensitive.
 
     Returns:
         True if request appears to be from a browser, False otherwise
     """
-    headers_lower = {k.lower(): v for k, v in headers.items()}
-    accept_header = headers_lower.get("accept", "")
-    user_agent = headers_lower.get("user-agent", "")
+    if isinstance(headers, dict):
+        headers = {k.lower(): v for k, v in headers.items()}
+    # Most API clients never send text/html, so skip the user-agent lookup
+    if "text/html" not in headers.get("accept", ""):
+        return False
 
-    if "text/html" in accept_header and "Mozilla" in user_agent:
-        return True
-
-    return False
+    return "Mozilla" in headers.get("user-agent", "")
 
 
 def create_x402_config(
@@ -76,13 +90,12 @@ def create_x402_config(
     }
 
 
-def inject_payment_data(
-    html_content: str,
+def _create_config_script(
     error: str,
-    payment_requirements: List[PaymentRequirements],
-    paywall_config: Optional[PaywallConfig] = None,
+    payment_requirements: list[PaymentRequirements],
+    paywall_config: PaywallConfig | None = None,
 ) -> str:
-    """Inject payment requirements into HTML as JavaScript variables."""
+    """Create the script tag that exposes payment data as window.x402."""
 
     # Create x402 configuration object
     x402_config = create_x402_config(error, payment_requirements, paywall_config)
@@ -94,12 +107,22 @@ def inject_payment_data(
         else ""
     )
 
-    config_script = f"""
+    return f"""
   <script>
     window.x402 = {json.dumps(x402_config)};
     {log_on_testnet}
   </script>"""
 
+
+def inject_payment_data(
+    html_content: str,
+    error: str,
+    payment_requirements: List[PaymentRequirements],
+    paywall_config: Optional[PaywallConfig] = None,
+) -> str:
+    """Inject payment requirements into HTML as JavaScript variables."""
+    config_script = _create_config_script(error, payment_requirements, paywall_config)
+
     # Inject the configuration script into the head
     return html_content.replace("</head>", f"{config_script}\n</head>")
 
@@ -123,5 +146,6 @@ def get_paywall_html(
     if not payment_requirements:
         raise ValueError("payment_requirements cannot be empty")
     network = payment_requirements[0].network
-    template = get_paywall_template(network)
-    return inject_payment_data(template, error, payment_requirements, paywall_config)
+    config_script = _create_config_script(error, payment_requirements, paywall_config)
+    head, _, tail = _get_paywall_template_parts(network)
+    return f"{head}{config_script}\n</head>{tail}"
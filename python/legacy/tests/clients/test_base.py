@@ -154,6 +154,15 @@ def test_create_payment_header(client, payment_requirements):
     assert "signature" in decoded["payload"]
 
 
+def test_create_payment_header_validity_window(client, payment_requirements):
+    header = client.create_payment_header(payment_requirements, 1)
+
+    authorization = decode_payment(header)["payload"]["authorization"]
+    valid_after = int(authorization["validAfter"])
+    valid_before = int(authorization["validBefore"])
+    assert valid_before - valid_after == payment_requirements.max_timeout_seconds + 60
+
+
 def test_payment_requirements_sorting(client):
     base_req = PaymentRequirements(
         scheme="exact",
@@ -1,13 +1,68 @@
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
 from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
 from fastapi.testclient import TestClient
+from x402.encoding import safe_base64_encode_model
 from x402.fastapi.middleware import require_payment
-from x402.types import PaywallConfig
+from x402.paywall import get_paywall_html
+from x402.types import (
+    EIP3009Authorization,
+    ExactPaymentPayload,
+    PaymentPayload,
+    PaymentRequirements,
+    PaywallConfig,
+    SettleResponse,
+    VerifyResponse,
+    x402PaymentRequiredResponse,
+)
 
 
 async def test_endpoint():
     return {"message": "success"}
 
 
+def create_payment_headers():
+    payment = PaymentPayload(
+        x402_version=1,
+        scheme="exact",
+        network="base-sepolia",
+        payload=ExactPaymentPayload(
+            signature="0x" + "00" * 65,
+            authorization=EIP3009Authorization(
+                from_="0x1",
+                to="0x1",
+                value="1000000",
+                valid_after="0",
+                valid_before="9999999999",
+                nonce="0x" + "00" * 32,
+            ),
+        ),
+    )
+    return {"X-PAYMENT": safe_base64_encode_model(payment)}
+
+
+@contextmanager
+def patch_facilitator(events=None):
+    """Accept every payment, recording each settlement in events."""
+
+    async def verify(self, payment, payment_requirements):
+        return VerifyResponse(is_valid=True, payer="0x1")
+
+    async def settle(self, payment, payment_requirements):
+        if events is not None:
+            events.append("settle")
+        return SettleResponse(success=True, transaction="0xabc", network="base-sepolia")
+
+    with (
+        patch("x402.facilitator.FacilitatorClient.verify", verify),
+        patch("x402.facilitator.FacilitatorClient.settle", settle),
+    ):
+        yield
+
+
 def test_middleware_invalid_payment():
     app_with_middleware = FastAPI()
     app_with_middleware.get("/test")(test_endpoint)
@@ -142,6 +197,37 @@ def test_path_matching():
     assert not path_is_match(["/exact", "/api/*", "regex:^/users/\\d+$"], "/other")
 
 
+def test_wildcard_in_path_list_skips_matching():
+    app_with_middleware = FastAPI()
+    app_with_middleware.get("/anything")(test_endpoint)
+    app_with_middleware.middleware("http")(
+        require_payment(
+            price="$1.00",
+            pay_to_address="0x1111111111111111111111111111111111111111",
+            path=["/api/*", "*"],
+            network="base-sepolia",
+        )
+    )
+
+    with patch("x402.fastapi.middleware.cached_path_is_match") as matcher:
+        response = TestClient(app_with_middleware).get("/anything")
+
+    assert response.status_code == 402
+    matcher.assert_not_called()
+
+
+def test_cached_path_matching():
+    from x402.path import cached_path_is_match
+
+    patterns = ("/exact", "/api/*", "regex:^/users/\\d+$")
+    for _ in range(2):
+        assert cached_path_is_match(patterns, "/exact")
+        assert cached_path_is_match(patterns, "/api/posts")
+        assert cached_path_is_match(patterns, "/users/123")
+        assert not cached_path_is_match(patterns, "/other")
+    assert cached_path_is_match.cache_info().hits >= 4
+
+
 def test_abusive_url_paths():
     """Test various abusive and edge-case URL paths that could bypass security"""
     from x402.path import path_is_match
@@ -347,6 +433,203 @@ def test_browser_request_returns_html():
     assert "window.x402" in html_content
 
 
+def test_browser_paywall_rendered_once_for_static_resource():
+    """Test that the paywall page for a fixed resource URL is rendered once."""
+    app = FastAPI()
+    app.get("/protected")(test_endpoint)
+    app.middleware("http")(
+        require_payment(
+            price="$1.00",
+            pay_to_address="0x1111111111111111111111111111111111111111",
+            path="/protected",
+            network="base-sepolia",
+            resource="https://example.com/protected",
+        )
+    )
+
+    client = TestClient(app)
+    browser_headers = {"Accept": "text/html", "User-Agent": "Mozilla/5.0"}
+
+    with patch(
+        "x402.fastapi.middleware.get_paywall_html", wraps=get_paywall_html
+    ) as render:
+        first = client.get("/protected", headers=browser_headers)
+        second = client.get("/protected", headers=browser_headers)
+
+    assert first.status_code == second.status_code == 402
+    assert first.text == second.text
+    assert "https://example.com/protected" in first.text
+    assert render.call_count == 1
+
+
+def test_browser_paywall_empty_resource_falls_back_to_request_url():
+    """Test that resource="" renders the paywall for the request URL."""
+    app = FastAPI()
+    app.get("/protected")(test_endpoint)
+    app.middleware("http")(
+        require_payment(
+            price="$1.00",
+            pay_to_address="0x1111111111111111111111111111111111111111",
+            path="/protected",
+            network="base-sepolia",
+            resource="",
+        )
+    )
+
+    response = TestClient(app).get(
+        "/protected", headers={"Accept": "text/html", "User-Agent": "Mozilla/5.0"}
+    )
+
+    assert response.status_code == 402
+    assert '"resource": "http://testserver/protected"' in response.text
+
+
+def test_json_402_body_serialized_once_for_static_resource():
+    """Test that the JSON 402 body for a fixed resource URL is built once per error."""
+    app = FastAPI()
+    app.get("/protected")(test_endpoint)
+    app.middleware("http")(
+        require_payment(
+            price="$1.00",
+            pay_to_address="0x1111111111111111111111111111111111111111",
+            path="/protected",
+            network="base-sepolia",
+            resource="https://example.com/protected",
+        )
+    )
+
+    client = TestClient(app)
+
+    with patch(
+        "x402.fastapi.middleware.x402PaymentRequiredResponse",
+        wraps=x402PaymentRequiredResponse,
+    ) as build:
+        first = client.get("/protected")
+        second = client.get("/protected")
+        invalid = client.get("/protected", headers={"X-PAYMENT": "invalid"})
+
+    assert first.status_code == second.status_code == invalid.status_code == 402
+    assert first.content == second.content
+    assert first.json()["error"] == "No X-PAYMENT header provided"
+    assert invalid.json()["error"] == "Invalid payment header format"
+    assert build.call_count == 2
+
+
+def test_json_402_body_empty_resource_falls_back_to_request_url():
+    """Test that resource="" reports the request URL in the JSON 402 body."""
+    app = FastAPI()
+    app.get("/protected")(test_endpoint)
+    app.middleware("http")(
+        require_payment(
+            price="$1.00",
+            pay_to_address="0x1111111111111111111111111111111111111111",
+            path="/protected",
+            network="base-sepolia",
+            resource="",
+        )
+    )
+
+    response = TestClient(app).get("/protected")
+
+    assert response.status_code == 402
+    assert response.json()["accepts"][0]["resource"] == "http://testserver/protected"
+
+
+def test_payment_requirements_reused_across_requests():
+    """Test that requirements are validated once and reused per URL and method."""
+    app = FastAPI()
+    app.get("/protected")(test_endpoint)
+
+    with patch(
+        "x402.fastapi.middleware.PaymentRequirements", wraps=PaymentRequirements
+    ) as build:
+        app.middleware("http")(
+            require_payment(
+                price="$1.00",
+                pay_to_address="0x1111111111111111111111111111111111111111",
+                path="/protected",
+                network="base-sepolia",
+            )
+        )
+        client = TestClient(app)
+        first = client.get("/protected")
+        second = client.get("/protected")
+        other = client.get("/protected?page=2")
+
+    assert first.json() == second.json()
+    assert other.json()["accepts"][0]["resource"].endswith("/protected?page=2")
+    assert other.json()["accepts"][0]["maxAmountRequired"] == "1000000"
+    # Only the template is validated; per-URL requirements are copies of it
+    assert build.call_count == 1
+
+
+def test_payment_details_not_shared_between_requests():
+    """Test that route changes to payment details do not leak into later requests."""
+    app = FastAPI()
+    seen = []
+
+    @app.get("/protected")
+    async def protected(request: Request):
+        details = request.state.payment_details
+        seen.append((details.description, dict(details.extra)))
+        details.description = "changed"
+        details.extra["name"] = "changed"
+        return {"message": "success"}
+
+    app.middleware("http")(
+        require_payment(
+            price="$1.00",
+            pay_to_address="0x1111111111111111111111111111111111111111",
+            path="/protected",
+            network="base-sepolia",
+            description="Original",
+        )
+    )
+
+    with patch_facilitator():
+        client = TestClient(app)
+        headers = create_payment_headers()
+        assert client.get("/protected", headers=headers).status_code == 200
+        assert client.get("/protected", headers=headers).status_code == 200
+        unpaid = client.get("/protected")
+
+    assert seen[0] == seen[1]
+    assert seen[0][0] == "Original"
+    assert seen[0][1]["name"] != "changed"
+    assert unpaid.json()["accepts"][0]["description"] == "Original"
+
+
+def test_stream_error_after_settlement_propagates():
+    """Test that a body failing after settlement surfaces instead of a 402."""
+    app = FastAPI()
+    events = []
+
+    @app.get("/stream")
+    async def stream():
+        async def body():
+            yield b"first,"
+            events.append("first")
+            raise RuntimeError("body failed")
+
+        return StreamingResponse(body())
+
+    app.middleware("http")(
+        require_payment(
+            price="$1.00",
+            pay_to_address="0x1111111111111111111111111111111111111111",
+            path="/stream",
+            network="base-sepolia",
+        )
+    )
+
+    with patch_facilitator(events):
+        client = TestClient(app)
+        with pytest.raises(RuntimeError, match="body failed"):
+            client.get("/stream", headers=create_payment_headers())
+
+    assert events == ["settle", "first"]
+
+
 def test_api_client_request_returns_json():
     """Test that API client requests return JSON response."""
     app = FastAPI()
@@ -1,5 +1,22 @@
-from flask import Flask, g
+import asyncio
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+
+from flask import Flask, Response, g
 from x402.flask.middleware import PaymentMiddleware
+from x402.common import process_price_to_atomic_amount
+from x402.encoding import safe_base64_encode_model
+from x402.paywall import get_paywall_html
+from x402.types import (
+    EIP3009Authorization,
+    ExactPaymentPayload,
+    PaymentPayload,
+    PaymentRequirements,
+    SettleResponse,
+    VerifyResponse,
+)
 
 
 def create_app_with_middleware(configs):
@@ -19,6 +36,82 @@ def create_app_with_middleware(configs):
     return app
 
 
+def create_payment_headers():
+    payment = PaymentPayload(
+        x402_version=1,
+        scheme="exact",
+        network="base-sepolia",
+        payload=ExactPaymentPayload(
+            signature="0x" + "00" * 65,
+            authorization=EIP3009Authorization(
+                from_="0x1",
+                to="0x1",
+                value="1000000",
+                valid_after="0",
+                valid_before="9999999999",
+                nonce="0x" + "00" * 32,
+            ),
+        ),
+    )
+    return {"X-PAYMENT": safe_base64_encode_model(payment)}
+
+
+@contextmanager
+def patch_facilitator(events=None):
+    """Accept every payment, recording each settlement in events."""
+
+    async def verify(self, payment, payment_requirements):
+        return VerifyResponse(is_valid=True, payer="0x1")
+
+    async def settle(self, payment, payment_requirements):
+        if events is not None:
+            events.append("settle")
+        return SettleResponse(success=True, transaction="0xabc", network="base-sepolia")
+
+    with (
+        patch("x402.facilitator.FacilitatorClient.verify", verify),
+        patch("x402.facilitator.FacilitatorClient.settle", settle),
+    ):
+        yield
+
+
+class RecordingBody:
+    """Response body that records each chunk it yields and when it is closed."""
+
+    def __init__(self, events, fail=False):
+        self.events = events
+        self.fail = fail
+
+    def __iter__(self):
+        self.events.append("first,")
+        yield "first,"
+        if self.fail:
+            raise RuntimeError("body failed")
+        self.events.append("second")
+        yield "second"
+
+    def close(self):
+        self.events.append("closed")
+
+
+def create_app_with_body(make_body, **options):
+    app = Flask(__name__)
+
+    @app.route("/protected")
+    def protected():
+        return Response(make_body())
+
+    middleware = PaymentMiddleware(app)
+    middleware.add(
+        price="$1.00",
+        pay_to_address="0x1",
+        path="/protected",
+        network="base-sepolia",
+        **options,
+    )
+    return app
+
+
 def test_payment_required_for_protected_route():
     app = create_app_with_middleware(
         [
@@ -133,6 +226,22 @@ def test_multiple_middleware_configs():
         assert client.get("/c").status_code == 200
 
 
+def test_each_registration_built_once():
+    app = Flask(__name__)
+    middleware = PaymentMiddleware(app)
+
+    with patch(
+        "x402.flask.middleware.process_price_to_atomic_amount",
+        wraps=process_price_to_atomic_amount,
+    ) as process_price:
+        for path in ["/a", "/b", "/c"]:
+            middleware.add(
+                price="$1.00", pay_to_address="0x1", path=path, network="base-sepolia"
+            )
+
+    assert process_price.call_count == 3
+
+
 def test_payment_details_in_g():
     app = Flask(__name__)
 
@@ -152,6 +261,177 @@ def test_payment_details_in_g():
         assert resp.status_code == 402
 
 
+def test_payment_details_not_shared_between_requests():
+    app = Flask(__name__)
+    seen = []
+
+    @app.route("/protected")
+    def protected():
+        details = g.payment_details
+        seen.append((details.description, dict(details.extra)))
+        details.description = "changed"
+        details.extra["name"] = "changed"
+        return {"message": "protected"}
+
+    middleware = PaymentMiddleware(app)
+    middleware.add(
+        price="$1.00",
+        pay_to_address="0x1",
+        path="/protected",
+        network="base-sepolia",
+        description="Original",
+    )
+
+    with patch_facilitator(), app.test_client() as client:
+        headers = create_payment_headers()
+        assert client.get("/protected", headers=headers).status_code == 200
+        assert client.get("/protected", headers=headers).status_code == 200
+        unpaid = client.get("/protected")
+
+    assert seen[0] == seen[1]
+    assert seen[0][0] == "Original"
+    assert seen[0][1]["name"] != "changed"
+    assert unpaid.json["accepts"][0]["description"] == "Original"
+
+
+def test_facilitator_calls_share_one_event_loop():
+    app = Flask(__name__)
+
+    @app.route("/protected")
+    def protected():
+        return {"message": "protected"}
+
+    middleware = PaymentMiddleware(app)
+    middleware.add(
+        price="$1.00", pay_to_address="0x1", path="/protected", network="base-sepolia"
+    )
+
+    headers = create_payment_headers()
+    loops = []
+
+    async def verify(self, payment, payment_requirements):
+        loops.append(asyncio.get_running_loop())
+        return VerifyResponse(
+            is_valid=False, invalid_reason="insufficient_funds", payer=None
+        )
+
+    with (
+        patch("x402.facilitator.FacilitatorClient.verify", verify),
+        app.test_client() as client,
+    ):
+        first = client.get("/protected", headers=headers)
+        second = client.get("/protected", headers=headers)
+
+    assert first.status_code == second.status_code == 402
+    assert first.json["error"] == "Invalid payment: insufficient_funds"
+    assert len(loops) == 2
+    assert loops[0] is loops[1]
+    assert loops[0].is_running()
+
+
+def test_close_stops_event_loop_thread():
+    app = Flask(__name__)
+
+    @app.route("/protected")
+    def protected():
+        return {"message": "protected"}
+
+    middleware = PaymentMiddleware(app)
+    middleware.add(
+        price="$1.00", pay_to_address="0x1", path="/protected", network="base-sepolia"
+    )
+    http_clients = []
+
+    async def verify(self, payment, payment_requirements):
+        http_clients.append(self._get_async_client())
+        return VerifyResponse(
+            is_valid=False, invalid_reason="insufficient_funds", payer=None
+        )
+
+    with (
+        patch("x402.facilitator.FacilitatorClient.verify", verify),
+        app.test_client() as client,
+    ):
+        assert (
+            client.get("/protected", headers=create_payment_headers()).status_code
+            == 402
+        )
+
+    loop, thread = middleware._loop, middleware._loop_thread
+    assert thread.is_alive()
+
+    middleware.close()
+
+    assert not thread.is_alive()
+    assert loop.is_closed()
+    assert http_clients[0].is_closed
+    assert middleware._loop is None
+    # Closing again is a no-op
+    middleware.close()
+
+
+def test_buffered_response_settled_after_body():
+    events = []
+    app = create_app_with_body(lambda: RecordingBody(events))
+
+    with patch_facilitator(events), app.test_client() as client:
+        resp = client.get("/protected", headers=create_payment_headers())
+
+    assert resp.status_code == 200
+    assert resp.get_data(as_text=True) == "first,second"
+    assert "X-PAYMENT-RESPONSE" in resp.headers
+    # By default the whole body is produced before the payment is settled
+    assert events == ["first,", "second", "closed", "settle"]
+
+
+def test_buffered_body_error_is_not_settled():
+    events = []
+    app = create_app_with_body(lambda: RecordingBody(events, fail=True))
+
+    with (
+        patch_facilitator(events),
+        app.test_client() as client,
+        pytest.raises(RuntimeError, match="body failed"),
+    ):
+        client.get("/protected", headers=create_payment_headers())
+
+    assert events == ["first,", "closed"]
+
+
+def test_response_streamed_after_settlement():
+    events = []
+    app = create_app_with_body(lambda: RecordingBody(events), stream_response=True)
+
+    with patch_facilitator(events), app.test_client() as client:
+        resp = client.get("/protected", headers=create_payment_headers())
+        body = resp.get_data(as_text=True)
+
+    assert resp.status_code == 200
+    assert body == "first,second"
+    assert "X-PAYMENT-RESPONSE" in resp.headers
+    # With streaming the body is only produced once the payment has been settled
+    assert events[:3] == ["settle", "first,", "second"]
+
+
+def test_stream_error_after_settlement_closes_body():
+    events = []
+    app = create_app_with_body(
+        lambda: RecordingBody(events, fail=True), stream_response=True
+    )
+
+    with patch_facilitator(events), app.test_client() as client:
+        resp = client.get("/protected", headers=create_payment_headers())
+        with pytest.raises(RuntimeError, match="body failed"):
+            resp.get_data()
+        resp.close()
+
+    # Settlement has already happened when the stream fails, and the app's
+    # body iterable is still closed once the server closes the response
+    assert resp.status_code == 200
+    assert "X-PAYMENT-RESPONSE" in resp.headers
+    assert events == ["settle", "first,", "closed"]
+
+
 def test_browser_request_returns_html():
     """Test that browser requests return HTML paywall instead of JSON."""
     app = create_app_with_middleware(
@@ -182,6 +462,99 @@ def test_browser_request_returns_html():
         assert "window.x402" in html_content
 
 
+def test_paywall_html_rendered_once_for_static_resource():
+    app = create_app_with_middleware(
+        [
+            {
+                "price": "$1.00",
+                "pay_to_address": "0x1",
+                "path": "/protected",
+                "network": "base-sepolia",
+                "resource": "https://example.com/protected",
+            }
+        ]
+    )
+    browser_headers = {
+        "Accept": "text/html",
+        "User-Agent": "Mozilla/5.0",
+    }
+
+    with (
+        patch(
+            "x402.flask.middleware.get_paywall_html", wraps=get_paywall_html
+        ) as render,
+        app.test_client() as client,
+    ):
+        first = client.get("/protected", headers=browser_headers)
+        second = client.get("/protected", headers=browser_headers)
+        proxied = client.get(
+            "/protected",
+            headers={**browser_headers, "X-Original-URI": "/protected?page=2"},
+        )
+
+    assert first.status_code == second.status_code == proxied.status_code == 402
+    assert first.get_data() == second.get_data()
+    assert "https://example.com/protected" in first.get_data(as_text=True)
+    assert "/protected?page=2" in proxied.get_data(as_text=True)
+    # Only the fixed resource is cached; the proxied URL is rendered per request
+    assert render.call_count == 2
+
+
+def test_paywall_html_not_cached_per_request_url():
+    app = create_app_with_middleware(
+        [
+            {
+                "price": "$1.00",
+                "pay_to_address": "0x1",
+                "path": "/protected",
+                "network": "base-sepolia",
+            }
+        ]
+    )
+    browser_headers = {
+        "Accept": "text/html",
+        "User-Agent": "Mozilla/5.0",
+    }
+
+    with (
+        patch(
+            "x402.flask.middleware.get_paywall_html", wraps=get_paywall_html
+        ) as render,
+        app.test_client() as client,
+    ):
+        client.get("/protected", headers=browser_headers)
+        client.get("/protected", headers=browser_headers)
+
+    assert render.call_count == 2
+
+
+def test_payment_requirements_reused_across_requests():
+    """Test that requirements are validated once and reused per URL and method."""
+    with patch(
+        "x402.flask.middleware.PaymentRequirements", wraps=PaymentRequirements
+    ) as build:
+        app = create_app_with_middleware(
+            [
+                {
+                    "price": "$1.00",
+                    "pay_to_address": "0x1",
+                    "path": "/protected",
+                    "network": "base-sepolia",
+                }
+            ]
+        )
+        with app.test_client() as client:
+            first = client.get("/protected")
+            second = client.get("/protected")
+            other = client.get("/protected?page=2")
+
+    assert first.json == second.json
+    assert other.json["accepts"][0]["resource"].endswith("/protected?page=2")
+    assert other.json["accepts"][0]["maxAmountRequired"] == "1000000"
+    # Only the template is validated; per-URL requirements are copies of it
+    assert build.call_count == 1
+
+
 def test_api_client_request_returns_json():
     """Test that API client requests return JSON response."""
     app = create_app_with_middleware(
@@ -4,6 +4,8 @@ from x402.common import (
     get_usdc_address,
     find_matching_payment_requirements,
 )
+from x402.chains import get_chain_id
+from x402.networks import EVM_NETWORK_TO_CHAIN_ID, SUPPORTED_NETWORKS_SET
 from x402.types import (
     TokenAmount,
     TokenAsset,
@@ -173,3 +175,9 @@ def test_find_matching_payment_requirements():
     payment.scheme = "different"  # No matching scheme
     match = find_matching_payment_requirements(requirements, payment)
     assert match is None
+
+
+def test_supported_networks_match_chain_table():
+    assert SUPPORTED_NETWORKS_SET == EVM_NETWORK_TO_CHAIN_ID.keys()
+    for network, chain_id in EVM_NETWORK_TO_CHAIN_ID.items():
+        assert get_chain_id(network) == str(chain_id)
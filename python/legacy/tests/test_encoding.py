@@ -1,5 +1,14 @@
+import binascii
+import json
+
 import pytest
-from x402.encoding import safe_base64_encode, safe_base64_decode
+from x402.encoding import (
+    safe_base64_encode,
+    safe_base64_decode,
+    safe_base64_decode_bytes,
+    safe_base64_encode_model,
+)
+from x402.types import SettleResponse
 
 
 def test_safe_base64_encode():
@@ -50,6 +59,30 @@ def test_safe_base64_decode():
         safe_base64_decode("//79")  # This is the base64 encoding of \xff\xfe\xfd
 
 
+def test_safe_base64_decode_bytes():
+    assert safe_base64_decode_bytes("aGVsbG8=") == b"hello"
+    assert safe_base64_decode_bytes("") == b""
+
+    # Non-utf8 payloads are returned as-is
+    assert safe_base64_decode_bytes("//79") == b"\xff\xfe\xfd"
+
+    with pytest.raises(binascii.Error):
+        safe_base64_decode_bytes("aGVsbG8")
+
+
+def test_safe_base64_encode_model():
+    settle_response = SettleResponse(
+        success=True, error_reason=None, transaction="0xabc", network="base"
+    )
+
+    encoded = safe_base64_encode_model(settle_response)
+
+    assert json.loads(safe_base64_decode(encoded)) == settle_response.model_dump(
+        by_alias=True
+    )
+    assert safe_base64_decode(encoded) == settle_response.model_dump_json(by_alias=True)
+
+
 def test_encode_decode_roundtrip():
     test_strings = [
         "hello",
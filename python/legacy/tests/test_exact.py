@@ -69,6 +69,9 @@ def test_prepare_payment_header(account, payment_requirements):
     assert auth["value"] == payment_requirements.max_amount_required
     assert isinstance(auth["nonce"], bytes)
     assert len(auth["nonce"]) == 32
+    assert int(auth["validBefore"]) - int(auth["validAfter"]) == (
+        payment_requirements.max_timeout_seconds + 60
+    )
 
 
 def test_sign_payment_header(account, payment_requirements):
@@ -104,6 +107,17 @@ def test_sign_payment_header(account, payment_requirements):
     assert int(auth["validBefore"]) > int(time.time())
 
 
+def test_sign_payment_header_with_nonce_bytes(account, payment_requirements):
+    unsigned_header = prepare_payment_header(account.address, 1, payment_requirements)
+    nonce = unsigned_header["payload"]["authorization"]["nonce"]
+
+    signed_message = sign_payment_header(account, payment_requirements, unsigned_header)
+
+    decoded = decode_payment(signed_message)
+    assert decoded["payload"]["authorization"]["nonce"] == f"0x{nonce.hex()}"
+    assert decoded["payload"]["signature"].startswith("0x")
+
+
 def test_sign_payment_header_no_account(payment_requirements):
     unsigned_header = prepare_payment_header(
         "0x0000000000000000000000000000000000000000", 1, payment_requirements
@@ -126,6 +140,11 @@ def test_encode_payment():
     decoded = decode_payment(encoded)
     assert decoded == data
 
+    # Test compact JSON output
+    assert (
+        base64.b64decode(encode_payment({"a": 1, "b": [1, 2]})) == b'{"a":1,"b":[1,2]}'
+    )
+
     # Test HexBytes handling
     hex_bytes = HexBytes("0x1234")
     data = {"test": hex_bytes}
@@ -0,0 +1,124 @@
+import asyncio
+import os
+
+from x402.facilitator import FacilitatorClient, shared_facilitator_client
+
+
+def test_shared_facilitator_client_per_config():
+    config = {"url": "https://facilitator.example.com"}
+
+    client = shared_facilitator_client(config)
+
+    assert shared_facilitator_client(dict(config)) is client
+    assert shared_facilitator_client({"url": "https://other.example.com"}) is not client
+    assert shared_facilitator_client() is shared_facilitator_client(None)
+
+
+def test_http_client_reused_within_event_loop():
+    facilitator = FacilitatorClient({"url": "https://facilitator.example.com"})
+
+    async def get_clients():
+        return facilitator._get_async_client(), facilitator._get_async_client()
+
+    first, second = asyncio.run(get_clients())
+    assert first is second
+
+    # A new event loop gets its own connection pool
+    third, _ = asyncio.run(get_clients())
+    assert third is not first
+
+
+def test_http_clients_kept_per_live_event_loop():
+    facilitator = FacilitatorClient({"url": "https://facilitator.example.com"})
+
+    async def get_client():
+        return facilitator._get_async_client()
+
+    loops = [asyncio.new_event_loop(), asyncio.new_event_loop()]
+    try:
+        first = [loop.run_until_complete(get_client()) for loop in loops]
+        # Alternating loops must not replace each other's clients
+        second = [loop.run_until_complete(get_client()) for loop in loops]
+        assert first == second
+        assert first[0] is not first[1]
+    finally:
+        for loop in loops:
+            loop.run_until_complete(facilitator.aclose())
+            loop.close()
+
+    assert all(client.is_closed for client in first)
+
+
+def test_switching_event_loops_leaves_no_clients_behind():
+    facilitator = FacilitatorClient({"url": "https://facilitator.example.com"})
+
+    async def get_client():
+        return facilitator._get_async_client()
+
+    for _ in range(3):
+        asyncio.run(get_client())
+
+    # Only the client for the most recent loop is still held
+    assert len(facilitator._http_clients) <= 1
+
+    async def get_and_close():
+        client = facilitator._get_async_client()
+        await facilitator.aclose()
+        return client
+
+    client = asyncio.run(get_and_close())
+    assert client.is_closed
+    assert len(facilitator._http_clients) == 0
+
+
+def test_aclose_leaves_other_loops_clients_open():
+    facilitator = FacilitatorClient({"url": "https://facilitator.example.com"})
+
+    async def get_client():
+        return facilitator._get_async_client()
+
+    other_loop = asyncio.new_event_loop()
+    try:
+        other = other_loop.run_until_complete(get_client())
+
+        async def get_and_close():
+            client = facilitator._get_async_client()
+            await facilitator.aclose()
+            return client
+
+        assert asyncio.run(get_and_close()).is_closed
+        # Another middleware sharing this facilitator keeps its own pool
+        assert not other.is_closed
+        assert other_loop.run_until_complete(get_client()) is other
+    finally:
+        other_loop.run_until_complete(facilitator.aclose())
+        other_loop.close()
+
+
+def test_clients_inherited_across_fork_dropped_without_awaiting(monkeypatch):
+    facilitator = FacilitatorClient({"url": "https://facilitator.example.com"})
+    parent_loop = asyncio.new_event_loop()
+
+    async def get_client():
+        return facilitator._get_async_client()
+
+    try:
+        inherited = parent_loop.run_until_complete(get_client())
+
+        # In a forked child the parent's loop object still claims to be running,
+        # but nothing will ever run a coroutine scheduled on it
+        monkeypatch.setattr(parent_loop, "is_running", lambda: True)
+        child_pid = os.getpid() + 1
+        monkeypatch.setattr(os, "getpid", lambda: child_pid)
+
+        async def close_in_child():
+            await asyncio.wait_for(facilitator.aclose(), timeout=1)
+
+        asyncio.run(close_in_child())
+
+        assert len(facilitator._http_clients) == 0
+        assert not inherited.is_closed
+    finally:
+        monkeypatch.undo()
+        parent_loop.run_until_complete(inherited.aclose())
+        parent_loop.close()
@@ -3,6 +3,7 @@ from x402.paywall import (
     create_x402_config,
     inject_payment_data,
     get_paywall_html,
+    get_paywall_template,
 )
 from x402.types import PaymentRequirements, PaywallConfig
 
@@ -24,6 +25,28 @@ class TestIsBrowserRequest:
         }
         assert is_browser_request(headers) is True
 
+    def test_browser_request_with_starlette_headers(self):
+        from starlette.datastructures import Headers
+
+        headers = Headers(
+            {
+                "Accept": "text/html,application/xhtml+xml",
+                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
+            }
+        )
+        assert is_browser_request(headers) is True
+
+    def test_browser_request_with_werkzeug_headers(self):
+        from werkzeug.datastructures import EnvironHeaders
+
+        headers = EnvironHeaders(
+            {
+                "HTTP_ACCEPT": "text/html,application/xhtml+xml",
+                "HTTP_USER_AGENT": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
+            }
+        )
+        assert is_browser_request(headers) is True
+
     def test_api_client_request(self):
         headers = {
             "Accept": "application/json",
@@ -256,3 +279,22 @@ class TestGetPaywallHtml:
         assert '"amount": 2.0' in result
         assert '"appName": "My App"' in result
         assert '"appLogo": "https://example.com/logo.png"' in result
+
+    def test_get_paywall_html_matches_injected_template(self):
+        payment_req = PaymentRequirements(
+            scheme="exact",
+            network="base-sepolia",
+            max_amount_required="1000000",
+            resource="https://example.com/api",
+            description="API access",
+            mime_type="application/json",
+            pay_to="0x456",
+            max_timeout_seconds=60,
+            asset="0xUSDC",
+        )
+
+        expected = inject_payment_data(
+            get_paywall_template("base-sepolia"), "Payment required", [payment_req]
+        )
+
+        assert get_paywall_html("Payment required", [payment_req]) == expected
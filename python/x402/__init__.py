@@ -58,6 +58,7 @@ from .client import (
     max_amount,
     prefer_network,
     prefer_scheme,
+    pure_policy,
     x402Client,
     x402ClientConfig,
     x402ClientSync,
@@ -161,6 +162,7 @@ __all__ = [
     "prefer_network",
     "prefer_scheme",
     "max_amount",
+    "pure_policy",
     # Interfaces
     "SchemeNetworkClient",
     "SchemeNetworkClientV1",
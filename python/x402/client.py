@@ -25,6 +25,8 @@ from .client_base import (
     max_amount,
     prefer_network,
     prefer_scheme,
+    pure_policy,
+    validate_hook,
     x402ClientBase,
     x402ClientConfig,
 )
@@ -45,6 +47,7 @@ __all__ = [
     "prefer_network",
     "prefer_scheme",
     "max_amount",
+    "pure_policy",
 ]
 
 
@@ -99,6 +102,11 @@ class x402Client(x402ClientBase):
                 client.register(scheme.network, scheme.client)  # type: ignore[arg-type]
         for policy in config.policies or []:
             client.register_policy(policy)
+        client.register_hooks(
+            before=config.before_payment_creation_hooks or (),
+            after=config.after_payment_creation_hooks or (),
+            on_failure=config.on_payment_creation_failure_hooks or (),
+        )
         return client
 
     # ========================================================================
@@ -108,16 +116,19 @@ class x402Client(x402ClientBase):
 
     def on_before_payment_creation(self, hook: BeforePaymentCreationHook) -> Self:
         """Register hook before payment creation. Return AbortResult to abort."""
+        validate_hook(hook)
         self._before_payment_creation_hooks.append(hook)
         return self
 
     def on_after_payment_creation(self, hook: AfterPaymentCreationHook) -> Self:
         """Register hook after successful payment creation."""
+        validate_hook(hook)
         self._after_payment_creation_hooks.append(hook)
         return self
 
     def on_payment_creation_failure(self, hook: OnPaymentCreationFailureHook) -> Self:
         """Register hook on failure. Return RecoveredPayloadResult to recover."""
+        validate_hook(hook)
         self._on_payment_creation_failure_hooks.append(hook)
         return self
 
@@ -220,6 +231,8 @@ class x402ClientSync(x402ClientBase):
         ```
     """
 
+    _allow_async_hooks = False
+
     def __init__(
         self,
         payment_requirements_selector: PaymentRequirementsSelector | None = None,
@@ -246,6 +259,11 @@ class x402ClientSync(x402ClientBase):
                 client.register(scheme.network, scheme.client)  # type: ignore[arg-type]
         for policy in config.policies or []:
             client.register_policy(policy)
+        client.register_hooks(
+            before=config.before_payment_creation_hooks or (),
+            after=config.after_payment_creation_hooks or (),
+            on_failure=config.on_payment_creation_failure_hooks or (),
+        )
         return client
 
     # ========================================================================
@@ -254,16 +272,19 @@ class x402ClientSync(x402ClientBase):
 
     def on_before_payment_creation(self, hook: SyncBeforePaymentCreationHook) -> Self:
         """Register hook before payment creation. Return AbortResult to abort."""
+        validate_hook(hook, allow_async=False)
         self._before_payment_creation_hooks.append(hook)
         return self
 
     def on_after_payment_creation(self, hook: SyncAfterPaymentCreationHook) -> Self:
         """Register hook after successful payment creation."""
+        validate_hook(hook, allow_async=False)
         self._after_payment_creation_hooks.append(hook)
         return self
 
     def on_payment_creation_failure(self, hook: SyncOnPaymentCreationFailureHook) -> Self:
         """Register hook on failure. Return RecoveredPayloadResult to recover."""
+        validate_hook(hook, allow_async=False)
         self._on_payment_creation_failure_hooks.append(hook)
         return self
 
@@ -6,7 +6,9 @@ Contains shared logic for client implementations.
 from __future__ import annotations
 
 import inspect
-from collections.abc import Awaitable, Callable, Generator
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Generator, Sequence
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
@@ -46,13 +48,16 @@ PaymentPolicy = Callable[[int, list[RequirementsView]], list[RequirementsView]]
 # Selector: choose final requirement from filtered list
 PaymentRequirementsSelector = Callable[[int, list[RequirementsView]], RequirementsView]
 
+# Maximum number of distinct accepts lists whose policy results are cached per client
+SELECTION_CACHE_SIZE = 128
+
 
 # ============================================================================
 # Configuration Types
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemeRegistration:
     """Configuration for registering a payment scheme with a specific network."""
 
@@ -61,13 +66,16 @@ class SchemeRegistration:
     x402_version: int = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class x402ClientConfig:
     """Configuration options for creating x402Client from config."""
 
     schemes: list[SchemeRegistration]
     policies: list[PaymentPolicy] | None = None
     payment_requirements_selector: PaymentRequirementsSelector | None = field(default=None)
+    before_payment_creation_hooks: list[BeforePaymentCreationHook] | None = None
+    after_payment_creation_hooks: list[AfterPaymentCreationHook] | None = None
+    on_payment_creation_failure_hooks: list[OnPaymentCreationFailureHook] | None = None
 
 
 # Hook types - support both sync and async (for async class auto-detection)
@@ -105,11 +113,56 @@ def default_payment_selector(
     return requirements[0]
 
 
+def validate_hook(hook: Any, *, allow_async: bool = True) -> None:
+    """Validate a hook once, at registration time.
+
+    Args:
+        hook: Hook being registered.
+        allow_async: Whether coroutine functions are accepted.
+
+    Raises:
+        TypeError: If hook is not callable, or is async when async is not allowed.
+    """
+    if not callable(hook):
+        raise TypeError(f"Hook must be callable, got {type(hook).__name__}")
+    if not allow_async and inspect.iscoroutinefunction(hook):
+        raise TypeError(
+            "Async hooks are not supported in x402ClientSync. "
+            "Use x402Client for async hook support."
+        )
+
+
 # ============================================================================
 # Built-in Policies
 # ============================================================================
 
 
+def pure_policy(policy: PaymentPolicy) -> PaymentPolicy:
+    """Mark a policy as pure so its results can be cached.
+
+    A pure policy has no side effects, only returns elements of its input
+    list, and only looks at each requirement's scheme, network, asset,
+    amount and pay_to. Selection over a previously seen accepts list then
+    skips the whole policy chain, as long as every registered policy is pure.
+    Policies with side effects must not be marked.
+
+    Only callables that accept attributes can be marked, such as plain
+    functions, partials and instances of callable classes. For a bound
+    method, mark the function it wraps or wrap it in a plain function.
+
+    Raises:
+        TypeError: If the policy does not accept the marker attribute.
+    """
+    try:
+        policy.pure = True  # type: ignore[attr-defined]
+    except AttributeError:
+        raise TypeError(
+            f"pure_policy cannot mark {type(policy).__name__} objects; "
+            "wrap the policy in a plain function first"
+        ) from None
+    return policy
+
+
 def prefer_network(network: Network) -> PaymentPolicy:
     """Create policy that prefers a specific network."""
 
@@ -118,7 +171,7 @@ def prefer_network(network: Network) -> PaymentPolicy:
         others = [r for r in reqs if r.network != network]
         return preferred + others
 
-    return policy
+    return pure_policy(policy)
 
 
 def prefer_scheme(scheme: str) -> PaymentPolicy:
@@ -129,7 +182,7 @@ def prefer_scheme(scheme: str) -> PaymentPolicy:
         others = [r for r in reqs if r.scheme != scheme]
         return preferred + others
 
-    return policy
+    return pure_policy(policy)
 
 
 def max_amount(max_value: int) -> PaymentPolicy:
@@ -138,7 +191,7 @@ def max_amount(max_value: int) -> PaymentPolicy:
     def policy(version: int, reqs: list[RequirementsView]) -> list[RequirementsView]:
         return [r for r in reqs if int(r.get_amount()) <= max_value]
 
-    return policy
+    return pure_policy(policy)
 
 
 # ============================================================================
@@ -153,6 +206,9 @@ class x402ClientBase:
     payment creation logic.
     """
 
+    # Whether coroutine-function hooks may be registered (False for sync clients)
+    _allow_async_hooks = True
+
     def __init__(
         self,
         payment_requirements_selector: PaymentRequirementsSelector | None = None,
@@ -161,7 +217,15 @@ class x402ClientBase:
         self._selector = payment_requirements_selector or default_payment_selector
         self._schemes: dict[Network, dict[str, SchemeNetworkClient]] = {}
         self._schemes_v1: dict[Network, dict[str, SchemeNetworkClientV1]] = {}
+        # Flat (version, network, scheme) -> client index for exact-network lookups
+        self._clients: dict[tuple[int, Network, str], Any] = {}
         self._policies: list[PaymentPolicy] = []
+        # Snapshot of exactly registered (network, scheme) pairs per version
+        self._supported_keys: dict[int, frozenset[tuple[Network, str]]] = {}
+        self._policy_cache: OrderedDict[tuple[Any, ...], tuple[int, ...]] = OrderedDict()
+        # Sync clients are shared across threads; guards every _policy_cache access
+        self._policy_cache_lock = threading.Lock()
+        self._policies_pure = True
 
         # Hooks (typed in subclasses)
         self._before_payment_creation_hooks: list[Any] = []
@@ -174,23 +238,71 @@ class x402ClientBase:
 
     def register(self, network: Network, client: SchemeNetworkClient) -> Self:
         """Register a V2 scheme client for a network."""
-        if network not in self._schemes:
-            self._schemes[network] = {}
-        self._schemes[network][client.scheme] = client
+        self._register_scheme(2, self._schemes, network, client)
         return self
 
     def register_v1(self, network: Network, client: SchemeNetworkClientV1) -> Self:
         """Register a V1 scheme client for a network."""
-        if network not in self._schemes_v1:
-            self._schemes_v1[network] = {}
-        self._schemes_v1[network][client.scheme] = client
+        self._register_scheme(1, self._schemes_v1, network, client)
         return self
 
     def register_policy(self, policy: PaymentPolicy) -> Self:
         """Add a requirement filter policy."""
         self._policies.append(policy)
+        self._policies_pure = self._policies_pure and getattr(policy, "pure", False)
+        self.clear_selection_cache()
+        return self
+
+    def register_hooks(
+        self,
+        before: Sequence[Any] = (),
+        after: Sequence[Any] = (),
+        on_failure: Sequence[Any] = (),
+    ) -> Self:
+        """Register several payment creation hooks in one call.
+
+        All hooks are validated before any is added, so a bad hook leaves
+        the client unchanged.
+
+        Args:
+            before: Hooks run before payment creation.
+            after: Hooks run after successful payment creation.
+            on_failure: Hooks run when payment creation fails.
+
+        Raises:
+            TypeError: If any hook is not callable or is async on a sync client.
+        """
+        for hook in (*before, *after, *on_failure):
+            validate_hook(hook, allow_async=self._allow_async_hooks)
+
+        self._before_payment_creation_hooks.extend(before)
+        self._after_payment_creation_hooks.extend(after)
+        self._on_payment_creation_failure_hooks.extend(on_failure)
         return self
 
+    def _register_scheme(
+        self,
+        version: int,
+        schemes: dict[Network, dict[str, Any]],
+        network: Network,
+        client: Any,
+    ) -> None:
+        """Store a scheme client, updating lookup structures only for new keys.
+
+        Replacing the client for an already registered (network, scheme) pair
+        leaves the supported set, and therefore cached policy results, unchanged.
+        """
+        by_scheme = schemes.setdefault(network, {})
+        scheme = client.scheme
+        is_new = scheme not in by_scheme
+        by_scheme[scheme] = client
+        self._clients[(version, network, scheme)] = client
+        if is_new:
+            self._supported_keys[version] = self._supported_keys.get(version, frozenset()) | {
+                (network, scheme)
+            }
+            self.clear_selection_cache()
+
     # ========================================================================
     # Selection (Shared)
     # ========================================================================
@@ -200,50 +312,157 @@ class x402ClientBase:
         requirements: list[PaymentRequirements],
     ) -> PaymentRequirements:
         """Select V2 requirements using policies and selector."""
+        return self._select_requirements(2, requirements, self._schemes)  # type: ignore[return-value, arg-type]
+
+    def _select_requirements_v1(
+        self,
+        requirements: list[PaymentRequirementsV1],
+    ) -> PaymentRequirementsV1:
+        """Select V1 requirements using policies and selector."""
+        return self._select_requirements(1, requirements, self._schemes_v1)  # type: ignore[return-value, arg-type]
+
+    def _select_requirements(
+        self,
+        version: int,
+        requirements: list[RequirementsView],
+        schemes: dict[Network, dict[str, Any]],
+    ) -> RequirementsView:
+        """Filter to supported schemes, apply policies and select final requirement."""
         # Filter to supported schemes
-        supported = []
-        for req in requirements:
-            schemes = find_schemes_by_network(self._schemes, req.network)
-            if schemes and req.scheme in schemes:
-                supported.append(req)
+        supported = self._filter_supported(version, requirements, schemes)
 
         if not supported:
             raise NoMatchingRequirementsError("No payment requirements match registered schemes")
 
         # Apply policies
-        filtered: list[RequirementsView] = list(supported)
-        for policy in self._policies:
-            filtered = policy(2, filtered)
-            if not filtered:
-                raise NoMatchingRequirementsError("All requirements filtered out by policies")
+        filtered = self._apply_policies(version, supported)
 
         # Select final
-        return self._selector(2, filtered)  # type: ignore[return-value]
+        return self._selector(version, filtered)
 
-    def _select_requirements_v1(
+    def _filter_supported(
         self,
-        requirements: list[PaymentRequirementsV1],
-    ) -> PaymentRequirementsV1:
-        """Select V1 requirements using policies and selector."""
-        # Filter to supported schemes
-        supported = []
+        version: int,
+        requirements: list[RequirementsView],
+        schemes: dict[Network, dict[str, Any]],
+    ) -> list[RequirementsView]:
+        """Return requirements whose (network, scheme) has a registered client."""
+        keys = self._supported_keys.get(version, frozenset())
+
+        # Most 402 responses carry a single accept: check it directly
+        if len(requirements) == 1:
+            req = requirements[0]
+            if (req.network, req.scheme) in keys:
+                return [req]
+            if req.network not in schemes:
+                network_schemes = find_schemes_by_network(schemes, req.network)
+                if network_schemes and req.scheme in network_schemes:
+                    return [req]
+            return []
+
+        supported: list[RequirementsView] = []
+        append = supported.append
         for req in requirements:
-            schemes = find_schemes_by_network(self._schemes_v1, req.network)
-            if schemes and req.scheme in schemes:
-                supported.append(req)
+            if (req.network, req.scheme) in keys:
+                append(req)
+            elif req.network not in schemes:
+                # Not registered verbatim; fall back to wildcard patterns
+                network_schemes = find_schemes_by_network(schemes, req.network)
+                if network_schemes and req.scheme in network_schemes:
+                    append(req)
+        return supported
+
+    def clear_selection_cache(self) -> None:
+        """Drop cached selection results.
+
+        Called automatically whenever a scheme or policy is registered.
+        """
+        with self._policy_cache_lock:
+            self._policy_cache.clear()
 
-        if not supported:
-            raise NoMatchingRequirementsError("No payment requirements match registered schemes")
+    def _apply_policies(
+        self,
+        version: int,
+        requirements: list[RequirementsView],
+    ) -> list[RequirementsView]:
+        """Run registered policies over the supported requirements in order."""
+        # Common case: no policies registered, nothing to filter
+        if not self._policies:
+            return requirements
+
+        if not self._policies_pure:
+            return self._run_policies(version, requirements)
+
+        # All policies are pure: reuse the result for a previously seen input
+        key = (
+            version,
+            tuple(
+                (req.scheme, req.network, req.asset, req.get_amount(), req.pay_to)
+                for req in requirements
+            ),
+        )
+        with self._policy_cache_lock:
+            # Pop and re-insert to mark as recently used; a missing key is a miss
+            indices = self._policy_cache.pop(key, None)
+            if indices is not None:
+                self._policy_cache[key] = indices
+        if indices is not None:
+            if not indices:
+                raise NoMatchingRequirementsError("All requirements filtered out by policies")
+            return [requirements[i] for i in indices]
 
-        # Apply policies
-        filtered: list[RequirementsView] = list(supported)
+        try:
+            filtered = self._run_policies(version, requirements)
+        except NoMatchingRequirementsError:
+            self._remember_policy_result(key, ())
+            raise
+
+        positions = {id(req): i for i, req in enumerate(requirements)}
+        if all(id(req) in positions for req in filtered):
+            self._remember_policy_result(key, tuple(positions[id(req)] for req in filtered))
+
+        return filtered
+
+    def _run_policies(
+        self,
+        version: int,
+        requirements: list[RequirementsView],
+    ) -> list[RequirementsView]:
+        """Run every registered policy, failing as soon as one empties the list."""
         for policy in self._policies:
-            filtered = policy(1, filtered)
-            if not filtered:
+            requirements = policy(version, requirements)
+            if not requirements:
                 raise NoMatchingRequirementsError("All requirements filtered out by policies")
 
-        # Select final
-        return self._selector(1, filtered)  # type: ignore[return-value]
+        return requirements
+
+    def _remember_policy_result(self, key: tuple[Any, ...], indices: tuple[int, ...]) -> None:
+        """Store policy output indices, evicting the least recently used entry."""
+        with self._policy_cache_lock:
+            self._policy_cache[key] = indices
+            if len(self._policy_cache) > SELECTION_CACHE_SIZE:
+                self._policy_cache.popitem(last=False)
+
+    def _get_client(self, version: int, network: Network, scheme: str) -> Any:
+        """Look up the registered client for a network and scheme.
+
+        Raises:
+            SchemeNotFoundError: If no client is registered for the pair.
+        """
+        # Exact network registration first, then wildcard patterns
+        client = self._clients.get((version, network, scheme))
+        if client is not None:
+            return client
+
+        schemes: dict[Network, dict[str, Any]] = (
+            self._schemes if version == 2 else self._schemes_v1  # type: ignore[assignment]
+        )
+        if network not in schemes:
+            by_scheme = find_schemes_by_network(schemes, network)
+            if by_scheme is not None and scheme in by_scheme:
+                return by_scheme[scheme]
+
+        raise SchemeNotFoundError(scheme, network)
 
     # ========================================================================
     # Introspection
@@ -253,17 +472,18 @@ class x402ClientBase:
         self,
     ) -> dict[int, list[dict[str, str]]]:
         """Get list of registered schemes for debugging."""
-        result: dict[int, list[dict[str, str]]] = {1: [], 2: []}
-
-        for network, schemes in self._schemes.items():
-            for scheme in schemes:
-                result[2].append({"network": network, "scheme": scheme})
-
-        for network, schemes in self._schemes_v1.items():
-            for scheme in schemes:
-                result[1].append({"network": network, "scheme": scheme})
-
-        return result
+        return {
+            1: [
+                {"network": network, "scheme": scheme}
+                for network, schemes in self._schemes_v1.items()
+                for scheme in schemes
+            ],
+            2: [
+                {"network": network, "scheme": scheme}
+                for network, schemes in self._schemes.items()
+                for scheme in schemes
+            ],
+        }
 
     # ========================================================================
     # Core Logic Generators (shared between async/sync)
@@ -282,27 +502,22 @@ class x402ClientBase:
         # 1. Select requirements
         selected = self._select_requirements_v2(payment_required.accepts)
 
-        # 2. Build context
-        context = PaymentCreationContext(
-            payment_required=payment_required,
-            selected_requirements=selected,
-        )
-
-        # 3. Execute before hooks
-        for hook in self._before_payment_creation_hooks:
-            result = yield ("before", hook, context)
-            if isinstance(result, AbortResult):
-                from .schemas import PaymentAbortedError
+        # 2-3. Build context and execute before hooks (skipped when none registered)
+        if self._before_payment_creation_hooks:
+            context = PaymentCreationContext(
+                payment_required=payment_required,
+                selected_requirements=selected,
+            )
+            for hook in self._before_payment_creation_hooks:
+                result = yield ("before", hook, context)
+                if isinstance(result, AbortResult):
+                    from .schemas import PaymentAbortedError
 
-                raise PaymentAbortedError(result.reason)
+                    raise PaymentAbortedError(result.reason)
 
         try:
             # 4. Find scheme client
-            schemes = find_schemes_by_network(self._schemes, selected.network)
-            if schemes is None or selected.scheme not in schemes:
-                raise SchemeNotFoundError(selected.scheme, selected.network)
-
-            client = schemes[selected.scheme]
+            client = self._get_client(2, selected.network, selected.scheme)
 
             # 5. Create inner payload (pass extensions for enrichment if scheme supports it)
             server_extensions = payment_required.extensions
@@ -330,17 +545,21 @@ class x402ClientBase:
             )
 
             # 7. Execute after hooks
-            result_context = PaymentCreatedContext(
-                payment_required=payment_required,
-                selected_requirements=selected,
-                payment_payload=payload,
-            )
-            for hook in self._after_payment_creation_hooks:
-                yield ("after", hook, result_context)
+            if self._after_payment_creation_hooks:
+                result_context = PaymentCreatedContext(
+                    payment_required=payment_required,
+                    selected_requirements=selected,
+                    payment_payload=payload,
+                )
+                for hook in self._after_payment_creation_hooks:
+                    yield ("after", hook, result_context)
 
             return payload
 
         except Exception as e:
+            if not self._on_payment_creation_failure_hooks:
+                raise
+
             # Execute failure hooks
             failure_context = PaymentCreationFailureContext(
                 payment_required=payment_required,
@@ -365,27 +584,22 @@ class x402ClientBase:
         # 1. Select requirements
         selected = self._select_requirements_v1(payment_required.accepts)
 
-        # 2. Build context
-        context = PaymentCreationContext(
-            payment_required=payment_required,
-            selected_requirements=selected,
-        )
-
-        # 3. Execute before hooks
-        for hook in self._before_payment_creation_hooks:
-            result = yield ("before", hook, context)
-            if isinstance(result, AbortResult):
-                from .schemas import PaymentAbortedError
+        # 2-3. Build context and execute before hooks (skipped when none registered)
+        if self._before_payment_creation_hooks:
+            context = PaymentCreationContext(
+                payment_required=payment_required,
+                selected_requirements=selected,
+            )
+            for hook in self._before_payment_creation_hooks:
+                result = yield ("before", hook, context)
+                if isinstance(result, AbortResult):
+                    from .schemas import PaymentAbortedError
 
-                raise PaymentAbortedError(result.reason)
+                    raise PaymentAbortedError(result.reason)
 
         try:
             # 4. Find scheme client
-            schemes = find_schemes_by_network(self._schemes_v1, selected.network)
-            if schemes is None or selected.scheme not in schemes:
-                raise SchemeNotFoundError(selected.scheme, selected.network)
-
-            client = schemes[selected.scheme]
+            client = self._get_client(1, selected.network, selected.scheme)
 
             # 5. Create inner payload
             inner_payload = client.create_payment_payload(selected)
@@ -399,17 +613,21 @@ class x402ClientBase:
             )
 
             # 7. Execute after hooks
-            result_context = PaymentCreatedContext(
-                payment_required=payment_required,
-                selected_requirements=selected,
-                payment_payload=payload,
-            )
-            for hook in self._after_payment_creation_hooks:
-                yield ("after", hook, result_context)
+            if self._after_payment_creation_hooks:
+                result_context = PaymentCreatedContext(
+                    payment_required=payment_required,
+                    selected_requirements=selected,
+                    payment_payload=payload,
+                )
+                for hook in self._after_payment_creation_hooks:
+                    yield ("after", hook, result_context)
 
             return payload
 
         except Exception as e:
+            if not self._on_payment_creation_failure_hooks:
+                raise
+
             # Execute failure hooks
             failure_context = PaymentCreationFailureContext(
                 payment_required=payment_required,
@@ -6,6 +6,8 @@ import base64
 import json
 from typing import Any
 
+from pydantic import BaseModel
+
 from ..schemas import (
     PaymentPayload,
     PaymentRequired,
@@ -17,7 +19,7 @@ from .constants import PAYMENT_REQUIRED_HEADER, X_PAYMENT_HEADER
 
 def safe_base64_encode(data: str) -> str:
     """Base64 encode a string safely."""
-    return base64.b64encode(data.encode("utf-8")).decode("utf-8")
+    return base64.b64encode(data.encode("utf-8")).decode("ascii")
 
 
 def safe_base64_decode(data: str) -> str:
@@ -25,17 +27,24 @@ def safe_base64_decode(data: str) -> str:
     return base64.b64decode(data.encode("utf-8")).decode("utf-8")
 
 
+def _encode_model_header(model: BaseModel) -> str:
+    """Serialize a model to JSON bytes and base64 encode them for a header."""
+    # Serialize straight to bytes; model_dump_json would decode to str first
+    json_bytes = model.__pydantic_serializer__.to_json(model, by_alias=True, exclude_none=True)
+    return base64.b64encode(json_bytes).decode("ascii")
+
+
 def encode_payment_signature_header(payload: PaymentPayload | PaymentPayloadV1) -> str:
     """Encode a payment payload as a base64 header value."""
-    return safe_base64_encode(payload.model_dump_json(by_alias=True, exclude_none=True))
+    return _encode_model_header(payload)
 
 
 def decode_payment_signature_header(
     header_value: str,
 ) -> PaymentPayload | PaymentPayloadV1:
     """Decode a base64 payment signature header into a PaymentPayload."""
-    json_str = safe_base64_decode(header_value)
-    data = json.loads(json_str)
+    # Parse the decoded bytes directly, skipping a utf-8 str round trip
+    data = json.loads(base64.b64decode(header_value))
 
     # Detect version
     version = data.get("x402Version", 2)
@@ -48,15 +57,14 @@ def encode_payment_required_header(
     payment_required: PaymentRequired | PaymentRequiredV1,
 ) -> str:
     """Encode a PaymentRequired object as a base64 header value."""
-    return safe_base64_encode(payment_required.model_dump_json(by_alias=True, exclude_none=True))
+    return _encode_model_header(payment_required)
 
 
 def decode_payment_required_header(
     header_value: str,
 ) -> PaymentRequired | PaymentRequiredV1:
     """Decode a base64 payment required header into a PaymentRequired object."""
-    json_str = safe_base64_decode(header_value)
-    data = json.loads(json_str)
+    data = json.loads(base64.b64decode(header_value))
 
     # Detect version
     version = data.get("x402Version", 2)
@@ -67,13 +75,12 @@ def decode_payment_required_header(
 
 def encode_payment_response_header(settle_response: SettleResponse) -> str:
     """Encode a SettleResponse object as a base64 header value."""
-    return safe_base64_encode(settle_response.model_dump_json(by_alias=True, exclude_none=True))
+    return _encode_model_header(settle_response)
 
 
 def decode_payment_response_header(header_value: str) -> SettleResponse:
     """Decode a base64 payment response header into a SettleResponse object."""
-    json_str = safe_base64_decode(header_value)
-    return SettleResponse.model_validate_json(json_str)
+    return SettleResponse.model_validate_json(base64.b64decode(header_value))
 
 
 def detect_payment_required_version(
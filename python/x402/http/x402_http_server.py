@@ -28,6 +28,10 @@ from .x402_http_server_base import PaywallProvider, x402HTTPServerBase
 if TYPE_CHECKING:
     from ..server import x402ResourceServerSync
 
+# asyncio.timeout (3.11+) arms a single timer on the running loop instead of
+# wrapping the hook in a new Task like asyncio.wait_for does.
+_asyncio_timeout = getattr(asyncio, "timeout", None)
+
 __all__ = [
     "x402HTTPResourceServer",
     "x402HTTPResourceServerSync",
@@ -260,16 +264,43 @@ class x402HTTPResourceServer(x402HTTPServerBase):
         if isinstance(options, PaymentOption):
             options = [options]
 
+        # Call every payTo/price hook up front and collect the ones that
+        # returned awaitables, so async hooks across all options overlap
+        # instead of stacking their latencies.
+        resolved: list[dict[str, Any]] = []
+        pending: list[tuple[dict[str, Any], str, Any]] = []
+        try:
+            for option in options:
+                fields: dict[str, Any] = {"pay_to": option.pay_to, "price": option.price}
+                for field_name in ("pay_to", "price"):
+                    value = fields[field_name]
+                    if not callable(value):
+                        continue
+                    result = value(context)
+                    if asyncio.iscoroutine(result) or asyncio.isfuture(result):
+                        pending.append((fields, field_name, result))
+                    else:
+                        fields[field_name] = result
+                resolved.append(fields)
+        except BaseException:
+            _discard_awaitables(awaitable for _, _, awaitable in pending)
+            raise
+
+        if len(pending) == 1:
+            fields, field_name, awaitable = pending[0]
+            fields[field_name] = await self._await_hook(awaitable, timeout)
+        elif pending:
+            results = await _gather_cancelling(
+                [self._await_hook(awaitable, timeout) for _, _, awaitable in pending]
+            )
+            for (fields, field_name, _), value in zip(pending, results, strict=True):
+                fields[field_name] = value
+
         all_requirements = []
 
-        for option in options:
-            # Resolve dynamic values for the option
-            pay_to = await self._resolve_value(
-                option.pay_to, context, timeout=timeout, field_name="pay_to"
-            )
-            price = await self._resolve_value(
-                option.price, context, timeout=timeout, field_name="price"
-            )
+        for option, fields in zip(options, resolved, strict=True):
+            pay_to = fields["pay_to"]
+            price = fields["price"]
 
             # Build requirements using server
             config = ResourceConfig(
@@ -286,22 +317,40 @@ class x402HTTPResourceServer(x402HTTPServerBase):
 
         return all_requirements
 
-    async def _resolve_value(
-        self,
-        value: Any,
-        context: HTTPRequestContext,
-        timeout: float | None,
-        field_name: str = "value",
-    ) -> Any:
-        """Resolve a value that could be a static value or an async/sync hook."""
-        if callable(value):
-            result = value(context)
-            # Check if the result is a coroutine or future (async)
-            if asyncio.iscoroutine(result) or asyncio.isfuture(result):
-                return await asyncio.wait_for(result, timeout=timeout)
-            # Synchronous function - return result directly
-            return result
-        return value
+    async def _await_hook(self, result: Any, timeout: float | None) -> Any:
+        """Await the coroutine or future returned by an async hook."""
+        if timeout is None:
+            return await result
+        if _asyncio_timeout is None:
+            return await asyncio.wait_for(result, timeout=timeout)
+        async with _asyncio_timeout(timeout):
+            return await result
+
+
+async def _gather_cancelling(awaitables: list[Any]) -> list[Any]:
+    """Await all hooks concurrently, cancelling the rest if one fails.
+
+    asyncio.gather leaves the remaining tasks running when one raises.
+    asyncio.TaskGroup would cancel them but wraps the error in an
+    ExceptionGroup, so hook errors would no longer surface as-is.
+    """
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _discard_awaitables(awaitables: Any) -> None:
+    """Close hook coroutines that will never be awaited."""
+    for awaitable in awaitables:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        else:
+            awaitable.cancel()
 
 
 # ============================================================================
@@ -337,15 +337,17 @@ class x402HTTPServerBase:
 
         # No payment provided
         if payment_payload is None:
+            # Browsers get the paywall page, so only API clients need the unpaid body
+            is_web_browser = self._is_web_browser(context.adapter)
             unpaid_body = None
-            if route_config.unpaid_response_body:
+            if route_config.unpaid_response_body and not is_web_browser:
                 unpaid_body = route_config.unpaid_response_body(context)
 
             return HTTPProcessResult(
                 type=RESULT_PAYMENT_ERROR,
                 response=self._create_http_response(
                     payment_required,
-                    is_web_browser=self._is_web_browser(context.adapter),
+                    is_web_browser=is_web_browser,
                     paywall_config=paywall_config,
                     custom_html=route_config.custom_paywall_html,
                     unpaid_response=unpaid_body,
@@ -577,9 +579,10 @@ class x402HTTPServerBase:
 
     def _is_web_browser(self, adapter: HTTPAdapter) -> bool:
         """Check if request is from a web browser."""
-        accept = adapter.get_accept_header()
-        user_agent = adapter.get_user_agent()
-        return "text/html" in accept and "Mozilla" in user_agent
+        # Most API clients never send text/html, so skip the user-agent lookup
+        if "text/html" not in adapter.get_accept_header():
+            return False
+        return "Mozilla" in adapter.get_user_agent()
 
     def _create_http_response(
         self,
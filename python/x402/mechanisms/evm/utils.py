@@ -20,6 +20,9 @@ from .constants import (
     NetworkConfig,
 )
 
+# Currency suffix stripped from money strings before parsing
+_MONEY_SUFFIX = re.compile(r"\s*(USD|USDC|usd|usdc)\s*$")
+
 
 def get_evm_chain_id(network: str) -> int:
     """Extract chain ID from a CAIP-2 network identifier (eip155:CHAIN_ID).
@@ -276,7 +279,7 @@ def parse_money_to_decimal(money: str | float | int) -> float:
     # Clean string
     clean = money.strip()
     clean = clean.lstrip("$")
-    clean = re.sub(r"\s*(USD|USDC|usd|usdc)\s*$", "", clean)
+    clean = _MONEY_SUFFIX.sub("", clean)
     clean = clean.strip()
 
     return float(clean)
@@ -56,6 +56,7 @@ class ExactSvmScheme:
         self._signer = signer
         self._custom_rpc_url = rpc_url
         self._clients: dict[str, SolanaClient] = {}
+        self._mints: dict[tuple[str, str], tuple[Pubkey, int]] = {}
 
     def _get_client(self, network: str) -> SolanaClient:
         """Get or create RPC client for network.
@@ -83,39 +84,31 @@ class ExactSvmScheme:
         self._clients[caip2_network] = client
         return client
 
-    def create_payment_payload(
-        self,
-        requirements: PaymentRequirements,
-    ) -> dict[str, Any]:
-        """Create signed SPL TransferChecked inner payload.
+    def _get_mint(self, network: str, client: SolanaClient, mint: Pubkey) -> tuple[Pubkey, int]:
+        """Get the token program and decimals for a mint, fetching it once per network.
+
+        Both are fixed when the mint is created, so the result is cached.
 
         Args:
-            requirements: Payment requirements from server.
+            network: Network identifier.
+            client: Solana RPC client for the network.
+            mint: Token mint address.
 
         Returns:
-            Inner payload dict (transaction).
-            x402Client wraps this with x402_version, accepted, resource, extensions.
+            Tuple of (token program, decimals).
 
         Raises:
-            ValueError: If feePayer is missing or invalid.
+            ValueError: If the mint is missing or owned by an unknown program.
         """
-        network = str(requirements.network)
-        client = self._get_client(network)
-
-        # Facilitator must provide feePayer to cover transaction fees
-        extra = requirements.extra or {}
-        fee_payer_str = extra.get("feePayer")
-        if not fee_payer_str:
-            raise ValueError("feePayer is required in requirements.extra for SVM transactions")
-        fee_payer = Pubkey.from_string(fee_payer_str)
-
-        mint = Pubkey.from_string(requirements.asset)
-        payer_pubkey = Pubkey.from_string(self._signer.address)
+        key = (normalize_network(network), str(mint))
+        cached = self._mints.get(key)
+        if cached is not None:
+            return cached
 
         # Fetch token mint info to get decimals and program
         mint_info = client.get_account_info(mint)
         if not mint_info.value:
-            raise ValueError(f"Token mint not found: {requirements.asset}")
+            raise ValueError(f"Token mint not found: {mint}")
 
         # Determine token program from mint owner
         mint_owner = str(mint_info.value.owner)
@@ -135,8 +128,41 @@ class ExactSvmScheme:
         #   45:    isInitialized (1 byte)
         #   46-49: freezeAuthorityOption (4 bytes)
         #   50-81: freezeAuthority (32 bytes)
-        mint_data = mint_info.value.data
-        decimals = mint_data[44]
+        decimals = mint_info.value.data[44]
+
+        self._mints[key] = (token_program, decimals)
+        return token_program, decimals
+
+    def create_payment_payload(
+        self,
+        requirements: PaymentRequirements,
+    ) -> dict[str, Any]:
+        """Create signed SPL TransferChecked inner payload.
+
+        Args:
+            requirements: Payment requirements from server.
+
+        Returns:
+            Inner payload dict (transaction).
+            x402Client wraps this with x402_version, accepted, resource, extensions.
+
+        Raises:
+            ValueError: If feePayer is missing or invalid.
+        """
+        network = str(requirements.network)
+        client = self._get_client(network)
+
+        # Facilitator must provide feePayer to cover transaction fees
+        extra = requirements.extra or {}
+        fee_payer_str = extra.get("feePayer")
+        if not fee_payer_str:
+            raise ValueError("feePayer is required in requirements.extra for SVM transactions")
+        fee_payer = Pubkey.from_string(fee_payer_str)
+
+        mint = Pubkey.from_string(requirements.asset)
+        payer_pubkey = Pubkey.from_string(self._signer.address)
+
+        token_program, decimals = self._get_mint(network, client, mint)
 
         # Derive ATAs
         source_ata_str = derive_ata(self._signer.address, requirements.asset, str(token_program))
@@ -60,6 +60,7 @@ class ExactSvmSchemeV1:
         self._signer = signer
         self._custom_rpc_url = rpc_url
         self._clients: dict[str, SolanaClient] = {}
+        self._mints: dict[tuple[str, str], tuple[Pubkey, int]] = {}
 
     def _get_client(self, network: str) -> SolanaClient:
         """Get or create RPC client for network.
@@ -87,6 +88,48 @@ class ExactSvmSchemeV1:
         self._clients[caip2_network] = client
         return client
 
+    def _get_mint(self, network: str, client: SolanaClient, mint: Pubkey) -> tuple[Pubkey, int]:
+        """Get the token program and decimals for a mint, fetching it once per network.
+
+        Both are fixed when the mint is created, so the result is cached.
+
+        Args:
+            network: Network identifier.
+            client: Solana RPC client for the network.
+            mint: Token mint address.
+
+        Returns:
+            Tuple of (token program, decimals).
+
+        Raises:
+            ValueError: If the mint is missing or owned by an unknown program.
+        """
+        key = (normalize_network(network), str(mint))
+        cached = self._mints.get(key)
+        if cached is not None:
+            return cached
+
+        # Fetch token mint info to get decimals and program
+        mint_info = client.get_account_info(mint)
+        if not mint_info.value:
+            raise ValueError(f"Token mint not found: {mint}")
+
+        # Determine token program from mint owner
+        mint_owner = str(mint_info.value.owner)
+        if mint_owner == TOKEN_PROGRAM_ADDRESS:
+            token_program = Pubkey.from_string(TOKEN_PROGRAM_ADDRESS)
+        elif mint_owner == TOKEN_2022_PROGRAM_ADDRESS:
+            token_program = Pubkey.from_string(TOKEN_2022_PROGRAM_ADDRESS)
+        else:
+            raise ValueError(f"Unknown token program: {mint_owner}")
+
+        # Parse mint data to get decimals
+        # SPL Token Mint layout: decimals is at byte 44
+        decimals = mint_info.value.data[44]
+
+        self._mints[key] = (token_program, decimals)
+        return token_program, decimals
+
     def create_payment_payload(
         self,
         requirements: PaymentRequirementsV1,
@@ -116,24 +159,7 @@ class ExactSvmSchemeV1:
         mint = Pubkey.from_string(requirements.asset)
         payer_pubkey = Pubkey.from_string(self._signer.address)
 
-        # Fetch token mint info to get decimals and program
-        mint_info = client.get_account_info(mint)
-        if not mint_info.value:
-            raise ValueError(f"Token mint not found: {requirements.asset}")
-
-        # Determine token program from mint owner
-        mint_owner = str(mint_info.value.owner)
-        if mint_owner == TOKEN_PROGRAM_ADDRESS:
-            token_program = Pubkey.from_string(TOKEN_PROGRAM_ADDRESS)
-        elif mint_owner == TOKEN_2022_PROGRAM_ADDRESS:
-            token_program = Pubkey.from_string(TOKEN_2022_PROGRAM_ADDRESS)
-        else:
-            raise ValueError(f"Unknown token program: {mint_owner}")
-
-        # Parse mint data to get decimals
-        # SPL Token Mint layout: decimals is at byte 44
-        mint_data = mint_info.value.data
-        decimals = mint_data[44]
+        token_program, decimals = self._get_mint(network, client, mint)
 
         # Derive ATAs
         source_ata_str = derive_ata(self._signer.address, requirements.asset, str(token_program))
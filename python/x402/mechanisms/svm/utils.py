@@ -29,6 +29,9 @@ from .constants import (
 )
 from .types import ExactSvmPayload, TransactionInfo
 
+# Currency suffix stripped from money strings before parsing
+_MONEY_SUFFIX = re.compile(r"\s*(USD|USDC|usd|usdc)\s*$")
+
 
 def normalize_network(network: str) -> str:
     """Normalize network identifier to CAIP-2 format.
@@ -205,7 +208,7 @@ def parse_money_to_decimal(money: str | float | int) -> float:
     # Clean string
     clean = money.strip()
     clean = clean.lstrip("$")
-    clean = re.sub(r"\s*(USD|USDC|usd|usdc)\s*$", "", clean)
+    clean = _MONEY_SUFFIX.sub("", clean)
     clean = clean.strip()
 
     return float(clean)
@@ -17,7 +17,7 @@ if TYPE_CHECKING:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class AbortResult:
     """Return from before hook to abort the operation.
 
@@ -28,7 +28,7 @@ class AbortResult:
     reason: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RecoveredPayloadResult:
     """Return from client failure hook to recover with a payload.
 
@@ -170,7 +170,7 @@ class SettleFailureContext(SettleContext):
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentCreationContext:
     """Context for payment creation hooks.
 
@@ -183,7 +183,7 @@ class PaymentCreationContext:
     selected_requirements: "PaymentRequirements | PaymentRequirementsV1"
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentCreatedContext(PaymentCreationContext):
     """Context for after-payment-creation hooks.
 
@@ -198,7 +198,7 @@ class PaymentCreatedContext(PaymentCreationContext):
             raise ValueError("payment_payload is required for PaymentCreatedContext")
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentCreationFailureContext(PaymentCreationContext):
     """Context for payment creation failure hooks.
 
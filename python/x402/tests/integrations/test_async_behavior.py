@@ -179,6 +179,84 @@ class TestAsyncHTTPHooks:
         assert result.response.status == 500
         assert "timed out" in result.response.body["error"].lower()
 
+    def test_async_hooks_resolved_concurrently(self) -> None:
+        """Test that payTo and price hooks run concurrently, not one after another."""
+        price_started = asyncio.Event()
+
+        async def pay_to_hook(context: HTTPRequestContext) -> str:
+            # Only completes if the price hook has started in the meantime
+            await price_started.wait()
+            return "merchant@example.com"
+
+        async def price_hook(context: HTTPRequestContext) -> str:
+            price_started.set()
+            return "$2.00"
+
+        routes = {
+            "GET /concurrent": {
+                "accepts": {
+                    "scheme": "cash",
+                    "network": "x402:cash",
+                    "payTo": pay_to_hook,
+                    "price": price_hook,
+                },
+                "hook_timeout_seconds": 1,
+            }
+        }
+        http_server = x402HTTPResourceServer(self.resource_server, routes)
+        context = HTTPRequestContext(
+            adapter=MockHTTPAdapter(path="/concurrent"), path="/concurrent", method="GET"
+        )
+
+        result = asyncio.run(http_server.process_http_request(context))
+        assert result.type == "payment-error"
+        payment_required = decode_payment_required_header(
+            result.response.headers["PAYMENT-REQUIRED"]
+        )
+        assert payment_required.accepts[0].pay_to == "merchant@example.com"
+        assert payment_required.accepts[0].amount == "2.00"
+
+    def test_failing_hook_cancels_concurrent_hooks(self) -> None:
+        """Test that a failing hook cancels the hooks still running alongside it."""
+        pay_to_cancelled = False
+
+        async def pay_to_hook(context: HTTPRequestContext) -> str:
+            nonlocal pay_to_cancelled
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                pay_to_cancelled = True
+                raise
+            return "merchant@example.com"
+
+        async def price_hook(context: HTTPRequestContext) -> str:
+            raise ValueError("price lookup failed")
+
+        routes = {
+            "GET /failing": {
+                "accepts": {
+                    "scheme": "cash",
+                    "network": "x402:cash",
+                    "payTo": pay_to_hook,
+                    "price": price_hook,
+                },
+            }
+        }
+        http_server = x402HTTPResourceServer(self.resource_server, routes)
+        context = HTTPRequestContext(
+            adapter=MockHTTPAdapter(path="/failing"), path="/failing", method="GET"
+        )
+
+        async def process() -> tuple[object, bool]:
+            result = await http_server.process_http_request(context)
+            # Checked before asyncio.run cancels leftover tasks on shutdown
+            return result, pay_to_cancelled
+
+        result, cancelled = asyncio.run(process())
+        assert result.type == "payment-error"
+        assert result.response.status == 500
+        assert cancelled
+
     def test_sync_hook_in_async_server_backward_compatible(self) -> None:
         """Test that synchronous hooks still work in async server (backward compat)."""
 
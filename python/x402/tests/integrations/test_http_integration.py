@@ -22,6 +22,7 @@ from x402 import (
 )
 from x402.http import (
     HTTPRequestContext,
+    HTTPResponseBody,
     ProcessSettleResult,
     decode_payment_required_header,
     x402HTTPClient,
@@ -727,3 +728,60 @@ class TestColonParamRouteMatching:
 
         result = components.process_http_request(context)
         assert result.type == "no-payment-required"
+
+
+class TestUnpaidResponseBody:
+    """Tests for the unpaid response body hook on 402 responses."""
+
+    @pytest.fixture(params=["sync", "async"])
+    def components(self, request: pytest.FixtureRequest) -> HTTPComponentsFixture:
+        self.calls: list[str] = []
+
+        def unpaid_body(context: HTTPRequestContext) -> HTTPResponseBody:
+            self.calls.append(context.path)
+            return HTTPResponseBody(content_type="application/json", body={"preview": True})
+
+        routes = {
+            "/api/protected": {
+                "accepts": {
+                    "scheme": "cash",
+                    "payTo": "merchant@example.com",
+                    "price": "$0.10",
+                    "network": "x402:cash",
+                },
+                "unpaidResponseBody": unpaid_body,
+            },
+        }
+        if request.param == "sync":
+            return _create_sync_http_components(routes)
+        return _create_async_http_components(routes)
+
+    def test_unpaid_body_returned_to_api_clients(
+        self,
+        components: HTTPComponentsFixture,
+    ) -> None:
+        adapter = MockHTTPAdapter(path="/api/protected", method="GET")
+        context = HTTPRequestContext(adapter=adapter, path="/api/protected", method="GET")
+
+        result = components.process_http_request(context)
+        assert result.response.status == 402
+        assert result.response.body == {"preview": True}
+        assert "PAYMENT-REQUIRED" in result.response.headers
+        assert self.calls == ["/api/protected"]
+
+    def test_unpaid_body_skipped_for_browsers(
+        self,
+        components: HTTPComponentsFixture,
+    ) -> None:
+        adapter = MockHTTPAdapter(
+            path="/api/protected",
+            method="GET",
+            headers={"Accept": "text/html", "User-Agent": "Mozilla/5.0"},
+        )
+        context = HTTPRequestContext(adapter=adapter, path="/api/protected", method="GET")
+
+        result = components.process_http_request(context)
+        assert result.response.status == 402
+        assert result.response.is_html is True
+        assert "PAYMENT-REQUIRED" not in result.response.headers
+        assert self.calls == []
@@ -1,10 +1,15 @@
 """Unit tests for x402Client and x402ClientSync - manual registration and policies."""
 
+import pytest
+
 from x402 import (
+    max_amount,
     prefer_network,
+    pure_policy,
     x402Client,
     x402ClientSync,
 )
+from x402.schemas import NoMatchingRequirementsError, PaymentRequirements, SchemeNotFoundError
 
 # =============================================================================
 # Mock Scheme Clients
@@ -37,6 +42,18 @@ class MockSchemeClientV1:
         return {"mock": "v1-payload", "network": requirements.network}
 
 
+def make_requirements(network: str = "eip155:8453", scheme: str = "mock") -> PaymentRequirements:
+    """Build V2 payment requirements for selection tests."""
+    return PaymentRequirements(
+        scheme=scheme,
+        network=network,
+        asset="0x0000000000000000000000000000000000000001",
+        amount="1000",
+        pay_to="0x0000000000000000000000000000000000000002",
+        max_timeout_seconds=300,
+    )
+
+
 # =============================================================================
 # x402Client Registration Tests
 # =============================================================================
@@ -82,6 +99,14 @@ class TestX402ClientRegistration:
         registered = client.get_registered_schemes()
         assert len(registered[2]) == 3
 
+    def test_reregistering_scheme_replaces_client(self):
+        """Test that registering the same scheme again replaces the client."""
+        first, second = MockSchemeClient(), MockSchemeClient()
+        client = x402Client().register("eip155:8453", first).register("eip155:8453", second)
+
+        assert client._schemes["eip155:8453"]["mock"] is second
+        assert client._supported_keys[2] == frozenset({("eip155:8453", "mock")})
+
     def test_chained_registration(self):
         """Test chaining registration calls."""
         client = (
@@ -157,6 +182,212 @@ class TestX402ClientPolicies:
         assert len(client._policies) == 2
 
 
+class TestX402ClientSelection:
+    """Tests for requirement selection through policies and selector."""
+
+    def test_selects_first_supported_without_policies(self):
+        """Test that the default selector picks the first supported requirement."""
+        client = x402Client().register("eip155:8453", MockSchemeClient())
+        unsupported = make_requirements(network="eip155:1")
+        supported = make_requirements()
+
+        selected = client._select_requirements_v2([unsupported, supported])
+
+        assert selected is supported
+
+    def test_policies_applied_in_order(self):
+        """Test that policies see the output of the previous policy."""
+        calls: list[int] = []
+
+        def record(version, reqs):
+            calls.append(len(reqs))
+            return reqs[1:]
+
+        client = (
+            x402Client()
+            .register("eip155:8453", MockSchemeClient())
+            .register("eip155:1", MockSchemeClient())
+            .register_policy(record)
+            .register_policy(record)
+        )
+        reqs = [
+            make_requirements(network="eip155:8453"),
+            make_requirements(network="eip155:1"),
+            make_requirements(network="eip155:8453"),
+        ]
+
+        selected = client._select_requirements_v2(reqs)
+
+        assert calls == [3, 2]
+        assert selected is reqs[2]
+
+    def test_wildcard_registration_supports_matching_networks(self):
+        """Test that wildcard registrations are honoured by selection."""
+        client = x402Client().register("eip155:*", MockSchemeClient())
+        reqs = [make_requirements(network="solana:mainnet"), make_requirements()]
+
+        assert client._select_requirements_v2(reqs) is reqs[1]
+
+    def test_single_accept_selected_directly(self):
+        """Test the single-accept path with exact, wildcard and unsupported networks."""
+        client = x402Client().register("eip155:8453", MockSchemeClient())
+        client.register("solana:*", MockSchemeClient())
+        exact, wildcard = make_requirements(), make_requirements(network="solana:mainnet")
+
+        assert client._select_requirements_v2([exact]) is exact
+        assert client._select_requirements_v2([wildcard]) is wildcard
+        with pytest.raises(NoMatchingRequirementsError):
+            client._select_requirements_v2([make_requirements(network="eip155:1")])
+
+    def test_exact_network_registration_takes_precedence(self):
+        """Test that an exact network entry shadows wildcard patterns."""
+        client = (
+            x402Client()
+            .register("eip155:*", MockSchemeClient("exact"))
+            .register("eip155:8453", MockSchemeClient("other"))
+        )
+
+        with pytest.raises(NoMatchingRequirementsError):
+            client._select_requirements_v2([make_requirements(scheme="exact")])
+
+    def test_get_client_resolves_exact_then_wildcard(self):
+        """Test client lookup by exact network first, then wildcard pattern."""
+        exact, wildcard = MockSchemeClient(), MockSchemeClient()
+        client = x402Client().register("eip155:8453", exact).register("eip155:*", wildcard)
+
+        assert client._get_client(2, "eip155:8453", "mock") is exact
+        assert client._get_client(2, "eip155:1", "mock") is wildcard
+        with pytest.raises(SchemeNotFoundError):
+            client._get_client(1, "eip155:8453", "mock")
+
+    def test_selection_returns_current_requirements(self):
+        """Test that repeated selections resolve against the new accepts list."""
+        client = x402Client().register("eip155:8453", MockSchemeClient())
+        first = [make_requirements(network="eip155:1"), make_requirements()]
+        second = [make_requirements(network="eip155:1"), make_requirements()]
+
+        assert client._select_requirements_v2(first) is first[1]
+        assert client._select_requirements_v2(second) is second[1]
+
+    def test_register_updates_supported_requirements(self):
+        """Test that registering a scheme widens later selections."""
+        client = x402Client().register("eip155:8453", MockSchemeClient())
+        reqs = [make_requirements(network="eip155:1"), make_requirements()]
+
+        assert client._select_requirements_v2(reqs) is reqs[1]
+
+        client.register("eip155:1", MockSchemeClient())
+
+        assert client._select_requirements_v2(reqs) is reqs[0]
+
+    def test_pure_policies_cached(self):
+        """Test that pure policy results are reused for the same accepts list."""
+        calls: list[int] = []
+
+        @pure_policy
+        def reverse(version, reqs):
+            calls.append(len(reqs))
+            return list(reversed(reqs))
+
+        client = (
+            x402Client()
+            .register("eip155:8453", MockSchemeClient())
+            .register("eip155:1", MockSchemeClient())
+            .register_policy(reverse)
+        )
+        first = [make_requirements(network="eip155:8453"), make_requirements(network="eip155:1")]
+        second = [make_requirements(network="eip155:8453"), make_requirements(network="eip155:1")]
+
+        assert client._select_requirements_v2(first) is first[1]
+        assert client._select_requirements_v2(second) is second[1]
+        assert calls == [2]
+
+    def test_impure_policy_disables_policy_cache(self):
+        """Test that one unmarked policy makes every selection rerun the chain."""
+        calls: list[int] = []
+
+        def record(version, reqs):
+            calls.append(len(reqs))
+            return reqs
+
+        client = (
+            x402Client()
+            .register("eip155:8453", MockSchemeClient())
+            .register_policy(max_amount(10_000))
+            .register_policy(record)
+        )
+        reqs = [make_requirements()]
+
+        client._select_requirements_v2(reqs)
+        client._select_requirements_v2(reqs)
+
+        assert calls == [1, 1]
+
+    def test_pure_policy_marks_callable_instances(self):
+        """Test that pure_policy accepts callables that take attributes."""
+
+        class Reverse:
+            def __call__(self, version, reqs):
+                return list(reversed(reqs))
+
+        policy = Reverse()
+
+        assert pure_policy(policy) is policy
+        assert policy.pure is True
+
+    def test_pure_policy_rejects_bound_methods(self):
+        """Test that marking a bound method raises a clear TypeError."""
+
+        class Policies:
+            def reverse(self, version, reqs):
+                return list(reversed(reqs))
+
+        with pytest.raises(TypeError, match="plain function"):
+            pure_policy(Policies().reverse)
+
+    def test_policy_cache_safe_across_threads(self, monkeypatch):
+        """Test that concurrent selections and cache clears never raise KeyError."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        monkeypatch.setattr("x402.client_base.SELECTION_CACHE_SIZE", 2)
+        client = (
+            x402ClientSync()
+            .register("eip155:8453", MockSchemeClient())
+            .register_policy(prefer_network("eip155:8453"))
+        )
+        shapes = [[make_requirements().model_copy(update={"amount": str(i)})] for i in range(8)]
+
+        def select(i: int) -> None:
+            reqs = shapes[i % len(shapes)]
+            assert client._select_requirements_v2(reqs) is reqs[0]
+            if i % 50 == 0:
+                client.clear_selection_cache()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(select, range(2000)))
+
+    def test_cached_policy_rejection_raises(self):
+        """Test that a cached empty policy result still raises."""
+        client = (
+            x402Client().register("eip155:8453", MockSchemeClient()).register_policy(max_amount(10))
+        )
+
+        for _ in range(2):
+            with pytest.raises(NoMatchingRequirementsError):
+                client._select_requirements_v2([make_requirements()])
+
+    def test_policy_filtering_everything_raises(self):
+        """Test that an empty policy result raises NoMatchingRequirementsError."""
+        client = (
+            x402Client()
+            .register("eip155:8453", MockSchemeClient())
+            .register_policy(lambda version, reqs: [])
+        )
+
+        with pytest.raises(NoMatchingRequirementsError):
+            client._select_requirements_v2([make_requirements()])
+
+
 class TestX402ClientSyncPolicies:
     """Tests for x402ClientSync policy registration."""
 
@@ -225,6 +456,50 @@ class TestX402ClientHooks:
         assert len(client._after_payment_creation_hooks) == 1
         assert len(client._on_payment_creation_failure_hooks) == 1
 
+    def test_non_callable_hook_rejected(self):
+        """Test that non-callable hooks are rejected at registration."""
+        client = x402Client()
+
+        with pytest.raises(TypeError, match="callable"):
+            client.on_after_payment_creation("not a hook")  # type: ignore[arg-type]
+
+    def test_async_hook_accepted(self):
+        """Test that async hooks can be registered on the async client."""
+        client = x402Client()
+
+        async def hook(ctx):
+            return None
+
+        client.on_before_payment_creation(hook)
+
+        assert client._before_payment_creation_hooks == [hook]
+
+
+class TestX402ClientBulkHooks:
+    """Tests for registering hooks in bulk."""
+
+    def test_register_hooks(self):
+        """Test that register_hooks appends to every hook list in order."""
+        client = x402Client()
+        before = [lambda ctx: None, lambda ctx: None]
+        after = [lambda ctx: None]
+
+        result = client.register_hooks(before=before, after=after)
+
+        assert result is client
+        assert client._before_payment_creation_hooks == before
+        assert client._after_payment_creation_hooks == after
+        assert client._on_payment_creation_failure_hooks == []
+
+    def test_register_hooks_is_all_or_nothing(self):
+        """Test that one invalid hook prevents any hook from being added."""
+        client = x402Client()
+
+        with pytest.raises(TypeError):
+            client.register_hooks(before=[lambda ctx: None], on_failure=[None])
+
+        assert client._before_payment_creation_hooks == []
+
 
 class TestX402ClientSyncHooks:
     """Tests for x402ClientSync hook registration."""
@@ -252,6 +527,18 @@ class TestX402ClientSyncHooks:
         assert len(client._after_payment_creation_hooks) == 1
         assert len(client._on_payment_creation_failure_hooks) == 1
 
+    def test_async_hook_rejected_at_registration(self):
+        """Test that async hooks are rejected when registered on sync client."""
+        client = x402ClientSync()
+
+        async def hook(ctx):
+            return None
+
+        with pytest.raises(TypeError, match="x402ClientSync"):
+            client.on_payment_creation_failure(hook)
+
+        assert client._on_payment_creation_failure_hooks == []
+
 
 # =============================================================================
 # get_registered_schemes Tests
@@ -1,5 +1,7 @@
 """Tests for x402Client.from_config() and x402ClientSync.from_config()."""
 
+import pytest
+
 from x402 import (
     SchemeRegistration,
     prefer_network,
@@ -174,6 +176,32 @@ class TestX402ClientFromConfig:
         # Policies are stored internally
         assert len(client._policies) == 1
 
+    def test_creates_client_with_hooks(self):
+        """Test that from_config registers hooks in bulk."""
+
+        def before(ctx):
+            return None
+
+        async def after(ctx):
+            return None
+
+        config = x402ClientConfig(
+            schemes=[
+                SchemeRegistration(
+                    network="eip155:8453",
+                    client=MockSchemeClient(),
+                ),
+            ],
+            before_payment_creation_hooks=[before],
+            after_payment_creation_hooks=[after],
+        )
+
+        client = x402Client.from_config(config)
+
+        assert client._before_payment_creation_hooks == [before]
+        assert client._after_payment_creation_hooks == [after]
+        assert client._on_payment_creation_failure_hooks == []
+
 
 class TestX402ClientSyncFromConfig:
     """Tests for x402ClientSync.from_config()."""
@@ -212,6 +240,25 @@ class TestX402ClientSyncFromConfig:
         client = x402ClientSync.from_config(config)
         assert len(client._policies) == 1
 
+    def test_rejects_async_hooks_on_sync_client(self):
+        """Test that from_config rejects async hooks for the sync client."""
+
+        async def after(ctx):
+            return None
+
+        config = x402ClientConfig(
+            schemes=[
+                SchemeRegistration(
+                    network="eip155:8453",
+                    client=MockSchemeClient(),
+                ),
+            ],
+            after_payment_creation_hooks=[after],
+        )
+
+        with pytest.raises(TypeError, match="x402ClientSync"):
+            x402ClientSync.from_config(config)
+
 
 class TestFromConfigMatchesManualRegistration:
     """Test that from_config produces equivalent clients to manual registration."""
@@ -1,8 +1,16 @@
 """Tests for ExactSvmScheme client."""
 
+from unittest.mock import MagicMock, patch
+
+from solders.hash import Hash
 from solders.keypair import Keypair
+from solders.pubkey import Pubkey
 
-from x402.mechanisms.svm import SOLANA_DEVNET_CAIP2, USDC_DEVNET_ADDRESS
+from x402.mechanisms.svm import (
+    SOLANA_DEVNET_CAIP2,
+    TOKEN_PROGRAM_ADDRESS,
+    USDC_DEVNET_ADDRESS,
+)
 from x402.mechanisms.svm.exact import ExactSvmClientScheme
 from x402.mechanisms.svm.signers import KeypairSigner
 from x402.schemas import PaymentRequirements
@@ -86,6 +94,32 @@ class TestCreatePaymentPayload:
         assert requirements.extra is not None
         assert requirements.extra.get("feePayer") is None
 
+    def test_mint_info_fetched_once_per_network(self):
+        """Mint program and decimals should be fetched once and reused."""
+        signer = KeypairSigner(Keypair.from_seed(bytes([1] * 32)))
+        client = ExactSvmClientScheme(signer)
+
+        rpc = MagicMock()
+        rpc.get_latest_blockhash.return_value.value.blockhash = Hash.default()
+        rpc.get_account_info.return_value.value.owner = Pubkey.from_string(TOKEN_PROGRAM_ADDRESS)
+        rpc.get_account_info.return_value.value.data = bytes(44) + bytes([6]) + bytes(37)
+
+        requirements = PaymentRequirements(
+            scheme="exact",
+            network=SOLANA_DEVNET_CAIP2,
+            asset=USDC_DEVNET_ADDRESS,
+            amount="100000",
+            pay_to=str(Keypair.from_seed(bytes([3] * 32)).pubkey()),
+            max_timeout_seconds=3600,
+            extra={"feePayer": str(Keypair.from_seed(bytes([2] * 32)).pubkey())},
+        )
+
+        with patch.object(client, "_get_client", return_value=rpc):
+            client.create_payment_payload(requirements)
+            client.create_payment_payload(requirements)
+
+        assert rpc.get_account_info.call_count == 1
+
 
 class TestClientSchemeAttributes:
     """Test client scheme attributes and methods."""